@@ -0,0 +1,12 @@
+"""
+Benchmarks do Sistema de Gestão - Clínica Vida+
+
+Este pacote contém os geradores de dados sintéticos e a suíte de
+benchmarks dos caminhos críticos do sistema.
+
+Execute a partir da pasta clinica-vida-plus:
+    python -m benchmarks.benchmark --escalas 1000 10000
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
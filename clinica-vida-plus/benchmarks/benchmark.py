@@ -0,0 +1,259 @@
+"""
+Suíte de Benchmarks - Clínica Vida+
+Módulo para medir os caminhos críticos do sistema
+
+Caminhos medidos em cada escala:
+- carregar_dados / salvar_dados (SistemaClinica)
+- buscar_por_nome (SistemaClinica)
+- validar_cpf (SistemaClinica)
+- inserir/remover na fila (FilaAtendimento)
+- verificar_acesso (ControleAcesso)
+
+Os resultados são gravados em JSON e podem ser comparados com uma
+baseline salva anteriormente. A comparação usa o menor tempo de cada
+benchmark, que sofre menos com ruído do sistema do que a mediana, e
+ignora medições abaixo de um piso (5 ms por padrão), curtas demais para
+serem estáveis. Tempos acima da tolerância são sinalizados como
+regressão e o processo termina com código 1.
+
+Uso (a partir da pasta clinica-vida-plus):
+    python -m benchmarks.benchmark --escalas 1000 10000 100000 1000000
+    python -m benchmarks.benchmark --salvar-baseline
+    python -m benchmarks.benchmark --baseline benchmarks/baseline.json
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import product
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.dados_sinteticos import gerar_pacientes
+from src.controle_acesso import ControleAcesso
+from src.fila_atendimento import FilaAtendimento, PacienteFila
+from src.main import Paciente, SistemaClinica
+
+ESCALAS_PADRAO = [1000, 10000, 100000, 1000000]
+REPETICOES_PADRAO = 7
+PISO_PADRAO = 0.005
+BASELINE_PADRAO = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Cada benchmark recebe o sistema já populado e devolve a função a medir
+Benchmark = Callable[[SistemaClinica], Callable[[], None]]
+
+
+def _bench_salvar_dados(sistema: SistemaClinica) -> Callable[[], None]:
+    return sistema.salvar_dados
+
+
+def _bench_carregar_dados(sistema: SistemaClinica) -> Callable[[], None]:
+    sistema.salvar_dados()
+    return sistema.carregar_dados
+
+
+def _bench_buscar_por_nome(sistema: SistemaClinica) -> Callable[[], None]:
+    def executar():
+        for busca in ("silva", "maria", "inexistente"):
+            sistema.buscar_por_nome(busca)
+    return executar
+
+
+def _bench_validar_cpf(sistema: SistemaClinica) -> Callable[[], None]:
+    cpfs = [p.cpf for p in sistema.pacientes]
+
+    def executar():
+        for cpf in cpfs:
+            SistemaClinica.validar_cpf(cpf)
+    return executar
+
+
+def _bench_fila(sistema: SistemaClinica) -> Callable[[], None]:
+    prioridades = ("normal", "preferencial", "emergencia")
+    entradas = [PacienteFila(p.nome, p.cpf, prioridades[i % 3])
+                for i, p in enumerate(sistema.pacientes)]
+
+    def executar():
+        fila = FilaAtendimento()
+        for paciente in entradas:
+            fila.adicionar(paciente)
+        while fila.remover_proximo() is not None:
+            pass
+    return executar
+
+
+def _bench_verificar_acesso(sistema: SistemaClinica) -> Callable[[], None]:
+    combinacoes = list(product((False, True), repeat=4))
+    total = len(sistema.pacientes)
+
+    def executar():
+        for i in range(total):
+            A, B, C, D = combinacoes[i % 16]
+            ControleAcesso.verificar_acesso(A, B, C, D, "emergencia" if i % 5 == 0 else "consulta_normal")
+    return executar
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "salvar_dados": _bench_salvar_dados,
+    "carregar_dados": _bench_carregar_dados,
+    "buscar_por_nome": _bench_buscar_por_nome,
+    "validar_cpf": _bench_validar_cpf,
+    "fila_inserir_remover": _bench_fila,
+    "verificar_acesso": _bench_verificar_acesso,
+}
+
+
+def medir(funcao: Callable[[], None], repeticoes: int) -> Dict[str, float]:
+    """
+    Mede o tempo de uma função várias vezes
+
+    Args:
+        funcao: Função sem argumentos a medir
+        repeticoes: Número de execuções
+
+    Returns:
+        Dicionário com mediana, mínimo e máximo em segundos
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return {
+        "mediana": statistics.median(tempos),
+        "minimo": min(tempos),
+        "maximo": max(tempos),
+        "repeticoes": repeticoes
+    }
+
+
+def executar_suite(escalas: List[int], repeticoes: int = REPETICOES_PADRAO, semente: int = 42,
+                   filtro: Optional[List[str]] = None) -> Dict:
+    """
+    Executa todos os benchmarks em todas as escalas
+
+    Args:
+        escalas: Números de pacientes a gerar
+        repeticoes: Execuções por benchmark
+        semente: Semente dos dados sintéticos
+        filtro: Nomes dos benchmarks a executar (None executa todos)
+
+    Returns:
+        Dicionário com metadados e resultados indexados por "nome@escala"
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as diretorio:
+        for escala in escalas:
+            # Mensagens de carregar/salvar não devem poluir a saída nem a medição
+            with contextlib.redirect_stdout(io.StringIO()):
+                sistema = SistemaClinica(
+                    arquivo_dados=os.path.join(diretorio, f"pacientes_{escala}.json"),
+                    dir_backup=os.path.join(diretorio, "backups"))
+                sistema.pacientes = [Paciente.from_dict(d) for d in gerar_pacientes(escala, semente)]
+
+            for nome, benchmark in BENCHMARKS.items():
+                if filtro and nome not in filtro:
+                    continue
+                with contextlib.redirect_stdout(io.StringIO()):
+                    funcao = benchmark(sistema)
+                    medicao = medir(funcao, repeticoes)
+                resultados[f"{nome}@{escala}"] = medicao
+                print(f"{nome:<22} {escala:>9} pacientes: {medicao['minimo']*1000:10.2f} ms")
+
+    return {
+        "metadados": {
+            "data": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semente": semente
+        },
+        "resultados": resultados
+    }
+
+
+def comparar_com_baseline(atual: Dict, baseline: Dict, tolerancia: float,
+                          piso: float = PISO_PADRAO) -> List[Dict]:
+    """
+    Compara os menores tempos de cada benchmark com uma baseline
+
+    Args:
+        atual: Saída de executar_suite
+        baseline: Saída de executar_suite salva anteriormente
+        tolerancia: Aumento relativo aceito (0.2 = 20%)
+        piso: Tempo em segundos abaixo do qual a comparação é ignorada
+              (nas duas medições), por ser dominada por ruído
+
+    Returns:
+        Lista de regressões com chave, tempos e razão atual/baseline
+    """
+    regressoes = []
+    for chave, medicao in atual["resultados"].items():
+        referencia = baseline["resultados"].get(chave)
+        if not referencia or referencia["minimo"] <= 0:
+            continue
+        if max(referencia["minimo"], medicao["minimo"]) < piso:
+            continue
+        razao = medicao["minimo"] / referencia["minimo"]
+        if razao > 1 + tolerancia:
+            regressoes.append({
+                "chave": chave,
+                "baseline": referencia["minimo"],
+                "atual": medicao["minimo"],
+                "razao": razao
+            })
+    return regressoes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Função principal do módulo"""
+    parser = argparse.ArgumentParser(description="Benchmarks do Sistema Clínica Vida+")
+    parser.add_argument("--escalas", type=int, nargs="+", default=ESCALAS_PADRAO)
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES_PADRAO)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--apenas", nargs="+", choices=sorted(BENCHMARKS),
+                        help="Executa apenas os benchmarks indicados")
+    parser.add_argument("--saida", help="Arquivo JSON para gravar os resultados")
+    parser.add_argument("--baseline", help="Baseline JSON para comparar os resultados")
+    parser.add_argument("--salvar-baseline", action="store_true",
+                        help=f"Grava os resultados como baseline em {BASELINE_PADRAO}")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    parser.add_argument("--piso", type=float, default=PISO_PADRAO,
+                        help="Ignora na comparação tempos abaixo deste valor (segundos)")
+    args = parser.parse_args(argv)
+
+    resultado = executar_suite(args.escalas, args.repeticoes, args.semente, args.apenas)
+
+    destinos = [args.saida] if args.saida else []
+    if args.salvar_baseline:
+        destinos.append(BASELINE_PADRAO)
+    for destino in destinos:
+        with open(destino, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"Resultados salvos em {destino}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressoes = comparar_com_baseline(resultado, baseline, args.tolerancia, args.piso)
+        for r in regressoes:
+            print(f"REGRESSÃO {r['chave']}: {r['baseline']*1000:.2f} ms -> "
+                  f"{r['atual']*1000:.2f} ms ({r['razao']:.2f}x)")
+        if regressoes:
+            return 1
+        print("Nenhuma regressão acima da tolerância")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
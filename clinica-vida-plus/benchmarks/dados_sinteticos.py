@@ -0,0 +1,78 @@
+"""
+Geradores de Dados Sintéticos - Clínica Vida+
+Módulo para gerar pacientes fictícios válidos para benchmarks
+
+Todos os geradores recebem um random.Random, então a mesma semente
+produz sempre os mesmos dados.
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator
+
+PRIMEIROS_NOMES = [
+    "João", "Maria", "José", "Ana", "Pedro", "Francisca", "Antônio", "Juliana",
+    "Carlos", "Márcia", "Paulo", "Fernanda", "Lucas", "Patrícia", "Luiz", "Aline",
+    "Marcos", "Sandra", "Gabriel", "Camila", "Rafael", "Letícia", "Daniel", "Bruna"
+]
+
+SOBRENOMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
+    "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho",
+    "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa", "Araújo"
+]
+
+DDDS = ["11", "21", "31", "41", "47", "51", "61", "71", "81", "85", "91"]
+
+
+def gerar_cpf(rng: random.Random) -> str:
+    """Gera um CPF válido formatado como XXX.XXX.XXX-XX"""
+    while True:
+        base = [rng.randint(0, 9) for _ in range(9)]
+        if base != [base[0]] * 9:
+            break
+
+    soma = sum(d * (10 - i) for i, d in enumerate(base))
+    base.append((soma * 10 % 11) % 10)
+    soma = sum(d * (11 - i) for i, d in enumerate(base))
+    base.append((soma * 10 % 11) % 10)
+
+    cpf = "".join(map(str, base))
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+def gerar_nome(rng: random.Random) -> str:
+    """Gera um nome completo com dois sobrenomes"""
+    return f"{rng.choice(PRIMEIROS_NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}"
+
+
+def gerar_telefone(rng: random.Random) -> str:
+    """Gera um telefone celular no formato (XX) 9XXXX-XXXX"""
+    return f"({rng.choice(DDDS)}) 9{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}"
+
+
+def gerar_pacientes(quantidade: int, semente: int = 42) -> Iterator[Dict]:
+    """
+    Gera dicionários de pacientes no formato de Paciente.to_dict
+
+    Args:
+        quantidade: Número de pacientes
+        semente: Semente do gerador pseudoaleatório
+
+    Yields:
+        Dicionários com nome, idade, telefone, cpf e data_cadastro
+    """
+    rng = random.Random(semente)
+    inicio = datetime(2024, 1, 1)
+    for _ in range(quantidade):
+        data = inicio + timedelta(seconds=rng.randint(0, 2 * 365 * 24 * 3600))
+        yield {
+            "nome": gerar_nome(rng),
+            "idade": rng.randint(1, 100),
+            "telefone": gerar_telefone(rng),
+            "cpf": gerar_cpf(rng),
+            "data_cadastro": data.strftime("%Y-%m-%d %H:%M:%S")
+        }
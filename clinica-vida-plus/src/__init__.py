@@ -12,4 +12,4 @@ Version: 1.0.0
 
 __version__ = "1.0.0"
 __author__ = "Sistema Clínica Vida+"
-__all__ = ["main", "controle_acesso", "fila_atendimento"]
+__all__ = ["main", "controle_acesso", "fila_atendimento", "auditoria", "checkin", "instrumentacao", "indices", "exportacao", "historico_fila"]
@@ -0,0 +1,293 @@
+"""
+Sistema de Auditoria de Acesso - Clínica Vida+
+Módulo para registro das decisões de controle de acesso
+
+Cada decisão é colocada em um buffer circular em memória e gravada em
+lotes por uma thread em segundo plano, em arquivos NDJSON compactados
+(gzip) com rotação diária e por tamanho:
+
+    logs/auditoria/auditoria_YYYYMMDD_NNN.ndjson.gz
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+try:
+    from colorama import Fore, Style
+    COLORS_AVAILABLE = True
+except ImportError:
+    COLORS_AVAILABLE = False
+    class Fore:
+        GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
+    class Style:
+        BRIGHT = RESET_ALL = ""
+
+
+class AuditoriaAcesso:
+    """
+    Classe para registrar decisões de acesso sem bloquear quem as consulta
+
+    registrar() apenas anexa o registro ao buffer; a gravação em disco
+    acontece na thread de escrita, a cada `intervalo` segundos ou quando o
+    buffer acumula `tamanho_lote` registros. Um lote cuja gravação falha
+    volta para o início do buffer e é gravado de novo no próximo ciclo. Se
+    o buffer encher antes da gravação, os registros mais antigos são
+    descartados e contabilizados em `descartados`.
+    """
+
+    def __init__(self, diretorio: Optional[str] = None, capacidade: int = 100000,
+                 tamanho_lote: int = 1000, intervalo: float = 1.0,
+                 tamanho_maximo: int = 10 * 1024 * 1024):
+        self.diretorio = diretorio or os.path.join("clinica-vida-plus", "logs", "auditoria")
+        self.capacidade = capacidade
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.tamanho_maximo = tamanho_maximo
+        self.descartados = 0
+        self._buffer = deque(maxlen=capacidade)
+        self._lock = threading.Lock()
+        # Serializa as gravações: descarregar() é público e pode rodar junto
+        # com a thread de escrita, e os dois anexariam ao mesmo arquivo
+        self._lock_escrita = threading.Lock()
+        self._sinal = threading.Event()
+        self._parar = False
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(self.diretorio, exist_ok=True)
+
+    def iniciar(self):
+        """Inicia a thread de escrita em segundo plano"""
+        if self._thread is not None:
+            return
+        self._parar = False
+        self._thread = threading.Thread(target=self._executar, name="auditoria-acesso",
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def registrar(self, resultado: Dict):
+        """
+        Registra uma decisão de acesso no buffer
+
+        Args:
+            resultado: Dicionário retornado por ControleAcesso.verificar_acesso
+        """
+        registro = (time.time(), resultado["tipo"], resultado["regra"],
+                    resultado["valores"], resultado["permitido"])
+        with self._lock:
+            if len(self._buffer) == self.capacidade:
+                self.descartados += 1
+            self._buffer.append(registro)
+            cheio = len(self._buffer) >= self.tamanho_lote
+        if cheio:
+            self._sinal.set()
+
+    def descarregar(self):
+        """Grava imediatamente todos os registros pendentes no buffer"""
+        with self._lock_escrita:
+            with self._lock:
+                lote = list(self._buffer)
+                self._buffer.clear()
+            if lote:
+                self._gravar_lote(lote)
+
+    def _devolver(self, registros: List[tuple]):
+        """Recoloca no início do buffer registros que não puderam ser gravados"""
+        with self._lock:
+            registros = registros + list(self._buffer)
+            excesso = len(registros) - self.capacidade
+            if excesso > 0:
+                self.descartados += excesso
+                registros = registros[excesso:]
+            self._buffer.clear()
+            self._buffer.extend(registros)
+
+    def fechar(self):
+        """Para a thread de escrita e grava o que restar no buffer"""
+        if self._thread is not None:
+            self._parar = True
+            self._sinal.set()
+            self._thread.join()
+            self._thread = None
+        self.descarregar()
+
+    def _executar(self):
+        """Laço da thread de escrita"""
+        while not self._parar:
+            self._sinal.wait(self.intervalo)
+            self._sinal.clear()
+            try:
+                self.descarregar()
+            except Exception as e:
+                print(f"{Fore.RED}Erro ao gravar auditoria (nova tentativa em "
+                      f"{self.intervalo:g}s): {e}")
+
+    def _gravar_lote(self, lote: List[tuple]):
+        """
+        Grava um lote de registros, separando por dia
+
+        Se a gravação de um dia falhar, o arquivo volta ao tamanho anterior
+        e os registros desse dia e dos seguintes voltam ao buffer antes de
+        a exceção ser propagada.
+        """
+        por_dia: Dict[str, List[str]] = {}
+        registros_por_dia: Dict[str, List[tuple]] = {}
+        for registro in lote:
+            timestamp, tipo, regra, valores, permitido = registro
+            momento = datetime.fromtimestamp(timestamp)
+            linha = json.dumps({
+                "timestamp": timestamp,
+                "data_hora": momento.strftime("%Y-%m-%d %H:%M:%S"),
+                "tipo": tipo,
+                "regra": regra,
+                "valores": valores,
+                "permitido": permitido
+            }, ensure_ascii=False)
+            dia = momento.strftime("%Y%m%d")
+            por_dia.setdefault(dia, []).append(linha)
+            registros_por_dia.setdefault(dia, []).append(registro)
+
+        dias = list(por_dia)
+        for posicao, dia in enumerate(dias):
+            conteudo = ("\n".join(por_dia[dia]) + "\n").encode("utf-8")
+            caminho = self._arquivo_atual(dia)
+            tamanho = os.path.getsize(caminho) if os.path.exists(caminho) else 0
+            try:
+                # Cada lote vira um novo membro gzip anexado ao arquivo atual
+                with gzip.open(caminho, "ab") as f:
+                    f.write(conteudo)
+            except Exception:
+                # Um membro gzip pela metade tornaria ilegível o resto do arquivo
+                try:
+                    with open(caminho, "r+b") as f:
+                        f.truncate(tamanho)
+                except OSError:
+                    pass
+                self._devolver([registro for pendente in dias[posicao:]
+                                for registro in registros_por_dia[pendente]])
+                raise
+
+    def _arquivo_atual(self, dia: str) -> str:
+        """Retorna o arquivo do dia, rotacionando quando excede o tamanho máximo"""
+        sequencia = 0
+        while True:
+            caminho = os.path.join(self.diretorio, f"auditoria_{dia}_{sequencia:03d}.ndjson.gz")
+            if not os.path.exists(caminho) or os.path.getsize(caminho) < self.tamanho_maximo:
+                return caminho
+            sequencia += 1
+
+    def consultar(self, inicio: datetime, fim: datetime) -> Iterator[Dict]:
+        """
+        Percorre os registros gravados dentro de um período
+
+        Apenas os arquivos cujos dias estão no período são abertos.
+
+        Args:
+            inicio: Início do período (inclusivo)
+            fim: Fim do período (exclusivo)
+
+        Yields:
+            Registros de auditoria em ordem de gravação
+        """
+        return consultar_auditoria(self.diretorio, inicio, fim)
+
+
+def consultar_auditoria(diretorio: str, inicio: datetime, fim: datetime) -> Iterator[Dict]:
+    """
+    Percorre os registros de auditoria de um diretório dentro de um período
+
+    Args:
+        diretorio: Diretório dos arquivos de auditoria
+        inicio: Início do período (inclusivo)
+        fim: Fim do período (exclusivo)
+
+    Yields:
+        Registros de auditoria em ordem de gravação
+    """
+    if not os.path.isdir(diretorio):
+        return
+    dia_inicio = inicio.strftime("%Y%m%d")
+    dia_fim = fim.strftime("%Y%m%d")
+    ts_inicio = inicio.timestamp()
+    ts_fim = fim.timestamp()
+
+    for nome in sorted(os.listdir(diretorio)):
+        if not (nome.startswith("auditoria_") and nome.endswith(".ndjson.gz")):
+            continue
+        dia = nome[len("auditoria_"):len("auditoria_") + 8]
+        if not dia_inicio <= dia <= dia_fim:
+            continue
+        with gzip.open(os.path.join(diretorio, nome), "rt", encoding="utf-8") as f:
+            for linha in f:
+                registro = json.loads(linha)
+                if ts_inicio <= registro["timestamp"] < ts_fim:
+                    yield registro
+
+
+def menu_interativo():
+    """Menu interativo para consultar os registros de auditoria"""
+    diretorio = os.path.join("clinica-vida-plus", "logs", "auditoria")
+
+    while True:
+        print(f"\n{Fore.BLUE}{Style.BRIGHT}{'='*50}")
+        print(f"{Fore.BLUE}{Style.BRIGHT}   AUDITORIA DE ACESSO - CLÍNICA VIDA+")
+        print(f"{Fore.BLUE}{Style.BRIGHT}{'='*50}")
+        print(f"{Fore.WHITE}1. {Fore.CYAN}Consultar registros por período")
+        print(f"{Fore.WHITE}2. {Fore.RED}Voltar")
+        print(f"{Fore.BLUE}{Style.BRIGHT}{'='*50}")
+
+        try:
+            opcao = input(f"\n{Fore.YELLOW}Escolha uma opção: ").strip()
+
+            if opcao == "1":
+                inicio = datetime.strptime(
+                    input(f"{Fore.WHITE}Data inicial (AAAA-MM-DD): ").strip(), "%Y-%m-%d")
+                fim = datetime.strptime(
+                    input(f"{Fore.WHITE}Data final (AAAA-MM-DD): ").strip(), "%Y-%m-%d")
+                fim += timedelta(days=1)
+
+                total = permitidos = 0
+                for registro in consultar_auditoria(diretorio, inicio, fim):
+                    total += 1
+                    permitidos += registro["permitido"]
+                    status = f"{Fore.GREEN}PERMITIDO" if registro["permitido"] else f"{Fore.RED}NEGADO"
+                    print(f"{Fore.WHITE}{registro['data_hora']} | "
+                          f"{registro['tipo']:<15} | {status}")
+
+                print(f"\n{Fore.CYAN}Total de decisões: {Fore.YELLOW}{total}")
+                print(f"{Fore.CYAN}Permitidas: {Fore.GREEN}{permitidos}")
+                print(f"{Fore.CYAN}Negadas: {Fore.RED}{total - permitidos}")
+
+            elif opcao == "2":
+                break
+
+            else:
+                print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 2")
+
+        except ValueError:
+            print(f"{Fore.RED}Data inválida. Use o formato AAAA-MM-DD")
+        except KeyboardInterrupt:
+            print(f"\n\n{Fore.YELLOW}Programa interrompido pelo usuário")
+            break
+        except Exception as e:
+            print(f"{Fore.RED}Erro: {e}")
+
+
+def main():
+    """Função principal do módulo"""
+    if not COLORS_AVAILABLE:
+        print("Aviso: colorama não instalado. Execute: pip install colorama\n")
+
+    menu_interativo()
+
+
+if __name__ == "__main__":
+    main()
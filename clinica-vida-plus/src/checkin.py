@@ -0,0 +1,109 @@
+"""
+Sistema de Check-in - Clínica Vida+
+Módulo para processar chegadas de pacientes em lote
+
+Junta em uma única passada as etapas do totem de atendimento:
+validação do CPF, consulta ao cadastro, verificação de acesso e
+inserção na fila. Os resultados são devolvidos como dicionários em vez
+de impressos no console.
+
+Prioridade da fila x regra de acesso:
+- emergencia   -> Emergência: C ∧ (B ∨ D)
+- preferencial -> Consulta Normal: (A ∧ B ∧ C) ∨ (B ∧ C ∧ D)
+- normal       -> Consulta Normal: (A ∧ B ∧ C) ∨ (B ∧ C ∧ D)
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+try:
+    from .controle_acesso import ControleAcesso
+    from .fila_atendimento import FilaAtendimento, PacienteFila
+    from .main import SistemaClinica
+except ImportError:
+    from controle_acesso import ControleAcesso
+    from fila_atendimento import FilaAtendimento, PacienteFila
+    from main import SistemaClinica
+
+
+class CheckIn:
+    """
+    Classe que processa lotes de chegadas e alimenta a fila de atendimento
+
+    Cada chegada é um dicionário com as chaves:
+    - cpf: CPF do paciente (com ou sem formatação)
+    - nome: Nome do paciente (opcional se houver cadastro)
+    - prioridade: "normal", "preferencial" ou "emergencia"
+    - A, B, C, D: Variáveis lógicas do controle de acesso
+    """
+
+    def __init__(self, fila: FilaAtendimento, sistema: Optional[SistemaClinica] = None):
+        """
+        Args:
+            fila: Fila que recebe os pacientes admitidos
+            sistema: Cadastro usado para localizar os pacientes; se informado,
+                     apenas pacientes cadastrados são admitidos
+        """
+        self.fila = fila
+        self.sistema = sistema
+
+    def processar_lote(self, chegadas: Iterable[Dict]) -> List[Dict]:
+        """
+        Processa um lote de chegadas em uma única passada
+
+        Args:
+            chegadas: Dicionários de chegada (ver docstring da classe)
+
+        Returns:
+            Lista de resultados, na ordem das chegadas, com as chaves
+            cpf, nome, prioridade, admitido, motivo e acesso
+        """
+        if self.sistema is not None:
+            # Sem isso, chegadas durante o carregamento inicial seriam recusadas
+            # como não cadastradas
+            self.sistema.aguardar_carregamento()
+
+        resultados = []
+        for chegada in chegadas:
+            cpf_numeros = re.sub(r'\D', '', chegada.get("cpf", ""))
+            prioridade = chegada.get("prioridade", "normal")
+            resultado = {
+                "cpf": chegada.get("cpf", ""),
+                "nome": chegada.get("nome", ""),
+                "prioridade": prioridade,
+                "admitido": False,
+                "motivo": "",
+                "acesso": None
+            }
+            resultados.append(resultado)
+
+            if not FilaAtendimento.validar_cpf(cpf_numeros):
+                resultado["motivo"] = "cpf_invalido"
+                continue
+
+            cpf_formatado = f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{cpf_numeros[9:]}"
+            resultado["cpf"] = cpf_formatado
+
+            if self.sistema is not None:
+                paciente = self.sistema.buscar_por_cpf(cpf_numeros)
+                if paciente is None:
+                    resultado["motivo"] = "nao_cadastrado"
+                    continue
+                resultado["nome"] = paciente.nome
+
+            tipo = "emergencia" if prioridade == "emergencia" else "consulta_normal"
+            acesso = ControleAcesso.verificar_acesso(
+                chegada.get("A", False), chegada.get("B", False),
+                chegada.get("C", False), chegada.get("D", False), tipo)
+            resultado["acesso"] = acesso
+
+            if not acesso["permitido"]:
+                resultado["motivo"] = "acesso_negado"
+                continue
+
+            self.fila.adicionar(PacienteFila(resultado["nome"], cpf_formatado, prioridade))
+            resultado["admitido"] = True
+
+        return resultados
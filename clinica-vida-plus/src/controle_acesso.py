@@ -16,7 +16,12 @@ Author: Sistema Clínica Vida+
 Date: 2025-10-15
 """
 
-from typing import Dict, List, Tuple
+from itertools import product
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+try:
+    from .auditoria import AuditoriaAcesso
+except ImportError:
+    from auditoria import AuditoriaAcesso
 try:
     from colorama import Fore, Style
     COLORS_AVAILABLE = True
@@ -28,9 +33,34 @@ except ImportError:
         BRIGHT = RESET_ALL = ""
 
 
+# Regras em forma normal disjuntiva (DNF): cada cláusula mapeia o índice da
+# variável (0=A, 1=B, 2=C, 3=D) para o valor que ela precisa assumir.
+# As tabelas verdade e as contagens derivam delas. consulta_normal e
+# emergencia mantêm a expressão direta porque rodam a cada chegada; os testes
+# garantem que as duas formas concordam.
+Regra = Sequence[Dict[int, bool]]
+
+NUM_VARIAVEIS = 4
+REGRA_CONSULTA_NORMAL: Regra = ({0: True, 1: True, 2: True}, {1: True, 2: True, 3: True})
+REGRA_EMERGENCIA: Regra = ({2: True, 1: True}, {2: True, 3: True})
+
+
 class ControleAcesso:
     """Classe para gerenciar o controle lógico de acesso de pacientes"""
 
+    # Auditoria opcional das decisões tomadas em verificar_acesso
+    auditoria: Optional[AuditoriaAcesso] = None
+
+    @staticmethod
+    def ativar_auditoria(auditoria: Optional[AuditoriaAcesso]):
+        """
+        Define a auditoria que registra as decisões de acesso
+
+        Args:
+            auditoria: Instância de AuditoriaAcesso ou None para desativar
+        """
+        ControleAcesso.auditoria = auditoria
+
     @staticmethod
     def consulta_normal(A: bool, B: bool, C: bool, D: bool) -> bool:
         """
@@ -65,6 +95,98 @@ class ControleAcesso:
         """
         return C and (B or D)
 
+    @staticmethod
+    def avaliar_regra(regra: Regra, valores: Sequence[bool]) -> bool:
+        """
+        Avalia uma regra em DNF para uma atribuição de valores
+
+        Args:
+            regra: Sequência de cláusulas {índice: valor exigido}
+            valores: Valores das variáveis, na ordem dos índices
+
+        Returns:
+            bool: True se alguma cláusula for satisfeita
+        """
+        return any(all(bool(valores[i]) == v for i, v in clausula.items()) for clausula in regra)
+
+    @staticmethod
+    def funcao_da_regra(regra: Regra) -> Callable[..., bool]:
+        """
+        Retorna uma função de N argumentos que avalia a regra
+
+        Args:
+            regra: Sequência de cláusulas {índice: valor exigido}
+        """
+        return lambda *valores: ControleAcesso.avaliar_regra(regra, valores)
+
+    @staticmethod
+    def gerar_linhas_tabela_verdade(num_variaveis: int,
+                                    funcao: Callable[..., bool]) -> Iterator[Tuple]:
+        """
+        Gera as linhas da tabela verdade sob demanda (gerador)
+
+        A ordem é a mesma dos laços aninhados: a primeira variável varia
+        mais devagar e False vem antes de True. Nenhuma lista de 2^N linhas
+        é construída, então a memória fica constante para qualquer N.
+
+        Args:
+            num_variaveis: Quantidade de variáveis lógicas
+            funcao: Função que recebe os N valores e retorna o resultado
+
+        Yields:
+            Tuplas com (valores..., Resultado)
+        """
+        for valores in product((False, True), repeat=num_variaveis):
+            yield valores + (funcao(*valores),)
+
+    @staticmethod
+    def contar_modelos(regra: Regra, num_variaveis: int) -> int:
+        """
+        Conta as atribuições que satisfazem a regra sem enumerar a tabela
+
+        Usa expansão de Shannon: escolhe a variável que aparece em mais
+        cláusulas e conta separadamente os casos em que ela é falsa e
+        verdadeira. Em cada ramo, cláusulas contraditas são descartadas e as
+        satisfeitas encurtam; se alguma cláusula fica vazia, todas as
+        atribuições das variáveis restantes valem, e sem cláusulas nenhuma
+        vale. Subproblemas repetidos são memorizados. O pior caso continua
+        exponencial em N, mas regras pequenas ou com variáveis compartilhadas
+        são contadas em poucos passos, independentemente do número de cláusulas.
+
+        Args:
+            regra: Sequência de cláusulas {índice: valor exigido}
+            num_variaveis: Quantidade total de variáveis
+
+        Returns:
+            int: Número de atribuições para as quais a regra é verdadeira
+        """
+        memoria: Dict[Tuple[FrozenSet, int], int] = {}
+
+        def contar(clausulas: FrozenSet[FrozenSet[Tuple[int, bool]]], livres: int) -> int:
+            if not clausulas:
+                return 0
+            if frozenset() in clausulas:
+                return 1 << livres
+            chave = (clausulas, livres)
+            if chave in memoria:
+                return memoria[chave]
+
+            ocorrencias: Dict[int, int] = {}
+            for clausula in clausulas:
+                for i, _ in clausula:
+                    ocorrencias[i] = ocorrencias.get(i, 0) + 1
+            variavel = max(ocorrencias, key=ocorrencias.get)
+
+            total = 0
+            for valor in (False, True):
+                restantes = frozenset(clausula - {(variavel, valor)} for clausula in clausulas
+                                      if (variavel, not valor) not in clausula)
+                total += contar(restantes, livres - 1)
+            memoria[chave] = total
+            return total
+
+        return contar(frozenset(frozenset(clausula.items()) for clausula in regra), num_variaveis)
+
     @staticmethod
     def gerar_tabela_verdade_consulta_normal() -> List[Tuple]:
         """
@@ -73,14 +195,8 @@ class ControleAcesso:
         Returns:
             Lista de tuplas com (A, B, C, D, Resultado)
         """
-        tabela = []
-        for A in [False, True]:
-            for B in [False, True]:
-                for C in [False, True]:
-                    for D in [False, True]:
-                        resultado = ControleAcesso.consulta_normal(A, B, C, D)
-                        tabela.append((A, B, C, D, resultado))
-        return tabela
+        return list(ControleAcesso.gerar_linhas_tabela_verdade(
+            NUM_VARIAVEIS, ControleAcesso.funcao_da_regra(REGRA_CONSULTA_NORMAL)))
 
     @staticmethod
     def gerar_tabela_verdade_emergencia() -> List[Tuple]:
@@ -90,14 +206,8 @@ class ControleAcesso:
         Returns:
             Lista de tuplas com (A, B, C, D, Resultado)
         """
-        tabela = []
-        for A in [False, True]:
-            for B in [False, True]:
-                for C in [False, True]:
-                    for D in [False, True]:
-                        resultado = ControleAcesso.emergencia(A, B, C, D)
-                        tabela.append((A, B, C, D, resultado))
-        return tabela
+        return list(ControleAcesso.gerar_linhas_tabela_verdade(
+            NUM_VARIAVEIS, ControleAcesso.funcao_da_regra(REGRA_EMERGENCIA)))
 
     @staticmethod
     def contar_situacoes_permitidas() -> Dict[str, int]:
@@ -107,16 +217,10 @@ class ControleAcesso:
         Returns:
             Dicionário com contagens para consulta normal e emergência
         """
-        tabela_normal = ControleAcesso.gerar_tabela_verdade_consulta_normal()
-        tabela_emergencia = ControleAcesso.gerar_tabela_verdade_emergencia()
-
-        permitidas_normal = sum(1 for linha in tabela_normal if linha[4])
-        permitidas_emergencia = sum(1 for linha in tabela_emergencia if linha[4])
-
         return {
-            "consulta_normal": permitidas_normal,
-            "emergencia": permitidas_emergencia,
-            "total_combinacoes": 16
+            "consulta_normal": ControleAcesso.contar_modelos(REGRA_CONSULTA_NORMAL, NUM_VARIAVEIS),
+            "emergencia": ControleAcesso.contar_modelos(REGRA_EMERGENCIA, NUM_VARIAVEIS),
+            "total_combinacoes": 2 ** NUM_VARIAVEIS
         }
 
     @staticmethod
@@ -130,11 +234,13 @@ class ControleAcesso:
         if tipo == "consulta_normal":
             print(f"\n{Fore.CYAN}{Style.BRIGHT}=== TABELA VERDADE: CONSULTA NORMAL ===")
             print(f"{Fore.YELLOW}Regra: (A ∧ B ∧ C) ∨ (B ∧ C ∧ D)")
-            tabela = ControleAcesso.gerar_tabela_verdade_consulta_normal()
+            tabela = ControleAcesso.gerar_linhas_tabela_verdade(
+                NUM_VARIAVEIS, ControleAcesso.funcao_da_regra(REGRA_CONSULTA_NORMAL))
         else:
             print(f"\n{Fore.CYAN}{Style.BRIGHT}=== TABELA VERDADE: EMERGÊNCIA ===")
             print(f"{Fore.YELLOW}Regra: C ∧ (B ∨ D)")
-            tabela = ControleAcesso.gerar_tabela_verdade_emergencia()
+            tabela = ControleAcesso.gerar_linhas_tabela_verdade(
+                NUM_VARIAVEIS, ControleAcesso.funcao_da_regra(REGRA_EMERGENCIA))
 
         print(f"\n{Fore.WHITE}{'A':^5} | {'B':^5} | {'C':^5} | {'D':^5} | {'Resultado':^10}")
         print(f"{'-'*50}")
@@ -171,7 +277,7 @@ class ControleAcesso:
             permitido = ControleAcesso.emergencia(A, B, C, D)
             regra = "C ∧ (B ∨ D)"
 
-        return {
+        resultado = {
             "permitido": permitido,
             "tipo": tipo,
             "regra": regra,
@@ -183,6 +289,11 @@ class ControleAcesso:
             }
         }
 
+        if ControleAcesso.auditoria is not None:
+            ControleAcesso.auditoria.registrar(resultado)
+
+        return resultado
+
 
 def menu_interativo():
     """Menu interativo para testar o sistema de controle de acesso"""
@@ -288,8 +399,14 @@ def main():
     if not COLORS_AVAILABLE:
         print("Aviso: colorama não instalado. Execute: pip install colorama\n")
 
+    auditoria = AuditoriaAcesso()
+    auditoria.iniciar()
+    ControleAcesso.ativar_auditoria(auditoria)
+
     menu_interativo()
 
+    auditoria.fechar()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,333 @@
+"""
+Sistema de Exportação - Clínica Vida+
+Módulo para exportar o cadastro de pacientes
+
+Formatos disponíveis:
+- CSV e NDJSON (um paciente por linha), opcionalmente compactados com gzip
+- Colunar: campos numéricos (idade, data de cadastro, CPF) em arrays
+  binários, gravados em blocos para leitura rápida por relatórios
+
+Todas as exportações percorrem os pacientes com geradores, então a
+memória usada não cresce com o tamanho do cadastro. Filtros por data de
+cadastro usam o índice de cadastro do SistemaClinica.
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import csv
+import gzip
+import json
+import os
+import re
+import struct
+from array import array
+from json.encoder import encode_basestring
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import IO, Dict, Iterator, Optional, Sequence
+try:
+    from colorama import Fore, Style
+    COLORS_AVAILABLE = True
+except ImportError:
+    COLORS_AVAILABLE = False
+    class Fore:
+        GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
+    class Style:
+        BRIGHT = RESET_ALL = ""
+try:
+    from .main import Paciente, SistemaClinica
+except ImportError:
+    from main import Paciente, SistemaClinica
+
+
+CAMPOS = ("nome", "idade", "telefone", "cpf", "data_cadastro")
+
+# Campos numéricos do formato colunar e o typecode do array de cada um
+CAMPOS_COLUNARES = {
+    "idade": "H",               # inteiro sem sinal de 16 bits
+    "timestamp_cadastro": "q",  # epoch em segundos, 64 bits
+    "cpf": "q",                 # 11 dígitos do CPF como inteiro
+}
+
+ASSINATURA_COLUNAR = b"CVPCOL1\n"
+TAMANHO_BLOCO = 65536
+
+
+def filtrar_pacientes(sistema: SistemaClinica, idade_min: Optional[int] = None,
+                      idade_max: Optional[int] = None, inicio: Optional[datetime] = None,
+                      fim: Optional[datetime] = None) -> Iterator[Paciente]:
+    """
+    Percorre os pacientes que atendem aos filtros
+
+    Com filtro de data, apenas o trecho correspondente do índice de
+    cadastro é percorrido (em ordem de cadastro).
+
+    Args:
+        sistema: Sistema de onde os pacientes são lidos
+        idade_min: Idade mínima (inclusivo)
+        idade_max: Idade máxima (inclusivo)
+        inicio: Data de cadastro inicial (inclusivo)
+        fim: Data de cadastro final (exclusivo)
+
+    Yields:
+        Pacientes que atendem aos filtros
+    """
+    sistema.aguardar_carregamento()
+
+    if inicio is not None or fim is not None:
+        pacientes = sistema.indice_cadastro.iterar_periodo(
+            inicio or datetime.fromtimestamp(0), fim or datetime(9999, 1, 1))
+    else:
+        pacientes = iter(sistema.pacientes)
+
+    if idade_min is None and idade_max is None:
+        yield from pacientes
+        return
+
+    minima = idade_min if idade_min is not None else 0
+    maxima = idade_max if idade_max is not None else float("inf")
+    for paciente in pacientes:
+        if minima <= paciente.idade <= maxima:
+            yield paciente
+
+
+def _linhas(pacientes: Iterator[Paciente], campos: Sequence[str]) -> Iterator[tuple]:
+    """Converte pacientes em tuplas de valores na ordem dos campos"""
+    for campo in campos:
+        if campo not in CAMPOS:
+            raise ValueError(f"Campo desconhecido: {campo}")
+    obter = attrgetter(*campos)
+    if len(campos) == 1:
+        return ((obter(p),) for p in pacientes)
+    return map(obter, pacientes)
+
+
+def _abrir_texto(caminho: str, compactar: bool) -> IO[str]:
+    """Abre o arquivo de destino em modo texto, com ou sem gzip"""
+    if compactar:
+        return gzip.open(caminho, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    return open(caminho, 'w', encoding='utf-8', newline='')
+
+
+def exportar_csv(sistema: SistemaClinica, caminho: str, campos: Sequence[str] = CAMPOS,
+                 compactar: bool = False, **filtros) -> int:
+    """
+    Exporta os pacientes para CSV
+
+    Args:
+        sistema: Sistema de onde os pacientes são lidos
+        caminho: Arquivo de destino
+        campos: Campos exportados, na ordem das colunas
+        compactar: Se True, grava com gzip
+        **filtros: idade_min, idade_max, inicio, fim (ver filtrar_pacientes)
+
+    Returns:
+        int: Quantidade de pacientes exportados
+    """
+    total = 0
+    with _abrir_texto(caminho, compactar) as f:
+        escritor = csv.writer(f)
+        escritor.writerow(campos)
+        for linha in _linhas(filtrar_pacientes(sistema, **filtros), campos):
+            escritor.writerow(linha)
+            total += 1
+    return total
+
+
+def exportar_ndjson(sistema: SistemaClinica, caminho: str, campos: Sequence[str] = CAMPOS,
+                    compactar: bool = False, **filtros) -> int:
+    """
+    Exporta os pacientes para NDJSON (um objeto JSON por linha)
+
+    Args:
+        sistema: Sistema de onde os pacientes são lidos
+        caminho: Arquivo de destino
+        campos: Campos exportados
+        compactar: Se True, grava com gzip
+        **filtros: idade_min, idade_max, inicio, fim (ver filtrar_pacientes)
+
+    Returns:
+        int: Quantidade de pacientes exportados
+    """
+    # Os campos são fixos, então cada linha é montada a partir de um modelo e
+    # só os textos passam pelo codificador JSON (bem mais rápido que json.dumps)
+    modelo = "{" + ", ".join(f'"{c}": ' + ("%d" if c == "idade" else "%s") for c in campos) + "}\n"
+    textuais = tuple(c != "idade" for c in campos)
+
+    total = 0
+    with _abrir_texto(caminho, compactar) as f:
+        for linha in _linhas(filtrar_pacientes(sistema, **filtros), campos):
+            f.write(modelo % tuple(encode_basestring(v) if textual else v
+                                   for textual, v in zip(textuais, linha)))
+            total += 1
+    return total
+
+
+def _cpf_numerico(paciente: Paciente) -> int:
+    """CPF como inteiro de 11 dígitos (-1 se ausente)"""
+    digitos = paciente.cpf.replace(".", "").replace("-", "")
+    if not digitos.isdigit():
+        digitos = re.sub(r'\D', '', digitos)
+    return int(digitos) if digitos else -1
+
+
+# Extração do valor numérico de cada campo colunar
+_EXTRATORES_COLUNARES = {
+    "idade": attrgetter("idade"),
+    "timestamp_cadastro": attrgetter("timestamp_cadastro"),
+    "cpf": _cpf_numerico,
+}
+
+
+def exportar_colunar(sistema: SistemaClinica, caminho: str,
+                     campos: Sequence[str] = tuple(CAMPOS_COLUNARES), **filtros) -> int:
+    """
+    Exporta os campos numéricos em formato colunar binário
+
+    Formato do arquivo:
+    - assinatura ASSINATURA_COLUNAR
+    - cabeçalho JSON de uma linha com campos e typecodes
+    - blocos de até TAMANHO_BLOCO linhas: quantidade de linhas (uint32)
+      seguida de um array por campo, na ordem do cabeçalho
+
+    Cada array usa a ordem de bytes nativa da máquina, registrada no cabeçalho.
+    CPFs ausentes são gravados como -1.
+
+    Args:
+        sistema: Sistema de onde os pacientes são lidos
+        caminho: Arquivo de destino
+        campos: Campos de CAMPOS_COLUNARES exportados
+        **filtros: idade_min, idade_max, inicio, fim (ver filtrar_pacientes)
+
+    Returns:
+        int: Quantidade de pacientes exportados
+    """
+    for campo in campos:
+        if campo not in CAMPOS_COLUNARES:
+            raise ValueError(f"Campo não numérico: {campo}")
+
+    cabecalho = {
+        "campos": list(campos),
+        "tipos": [CAMPOS_COLUNARES[c] for c in campos],
+        "ordem_bytes": "little" if array("H", [1]).tobytes()[0] == 1 else "big"
+    }
+    total = 0
+    with open(caminho, 'wb') as f:
+        f.write(ASSINATURA_COLUNAR)
+        f.write(json.dumps(cabecalho).encode("utf-8") + b"\n")
+
+        colunas = [array(CAMPOS_COLUNARES[c]) for c in campos]
+
+        def gravar_bloco():
+            f.write(struct.pack("<I", len(colunas[0])))
+            for coluna in colunas:
+                coluna.tofile(f)
+                del coluna[:]
+
+        extratores = [(coluna.append, _EXTRATORES_COLUNARES[c]) for coluna, c in zip(colunas, campos)]
+        for paciente in filtrar_pacientes(sistema, **filtros):
+            for adicionar, extrair in extratores:
+                adicionar(extrair(paciente))
+            total += 1
+            if len(colunas[0]) == TAMANHO_BLOCO:
+                gravar_bloco()
+        if colunas and len(colunas[0]):
+            gravar_bloco()
+
+    return total
+
+
+def ler_colunar(caminho: str) -> Iterator[Dict[str, array]]:
+    """
+    Lê um arquivo gerado por exportar_colunar bloco a bloco
+
+    Args:
+        caminho: Arquivo colunar
+
+    Yields:
+        Dicionário campo -> array com as linhas de um bloco
+    """
+    with open(caminho, 'rb') as f:
+        if f.read(len(ASSINATURA_COLUNAR)) != ASSINATURA_COLUNAR:
+            raise ValueError("Arquivo não está no formato colunar")
+        cabecalho = json.loads(f.readline())
+        inverter = cabecalho["ordem_bytes"] != ("little" if array("H", [1]).tobytes()[0] == 1 else "big")
+
+        while True:
+            tamanho = f.read(4)
+            if not tamanho:
+                break
+            linhas = struct.unpack("<I", tamanho)[0]
+            bloco = {}
+            for campo, tipo in zip(cabecalho["campos"], cabecalho["tipos"]):
+                coluna = array(tipo)
+                coluna.fromfile(f, linhas)
+                if inverter:
+                    coluna.byteswap()
+                bloco[campo] = coluna
+            yield bloco
+
+
+def menu_interativo(sistema: SistemaClinica):
+    """Menu interativo para exportar o cadastro"""
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}=== EXPORTAR DADOS ===")
+    print(f"{Fore.WHITE}1. {Fore.CYAN}CSV")
+    print(f"{Fore.WHITE}2. {Fore.CYAN}NDJSON")
+    print(f"{Fore.WHITE}3. {Fore.CYAN}Colunar (campos numéricos)")
+
+    try:
+        formato = input(f"{Fore.YELLOW}Escolha o formato: ").strip()
+        if formato not in ("1", "2", "3"):
+            print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 3")
+            return
+
+        compactar = formato != "3" and input(
+            f"{Fore.WHITE}Compactar com gzip? (S/N): ").strip().upper() == 'S'
+
+        filtros = {}
+        idade_min = input(f"{Fore.WHITE}Idade mínima (Enter para todas): ").strip()
+        idade_max = input(f"{Fore.WHITE}Idade máxima (Enter para todas): ").strip()
+        inicio = input(f"{Fore.WHITE}Cadastrados a partir de (AAAA-MM-DD, Enter para todos): ").strip()
+        fim = input(f"{Fore.WHITE}Cadastrados até (AAAA-MM-DD, Enter para todos): ").strip()
+        if idade_min:
+            filtros["idade_min"] = int(idade_min)
+        if idade_max:
+            filtros["idade_max"] = int(idade_max)
+        if inicio:
+            filtros["inicio"] = datetime.strptime(inicio, "%Y-%m-%d")
+        if fim:
+            filtros["fim"] = datetime.strptime(fim, "%Y-%m-%d") + timedelta(days=1)
+
+        extensao = {"1": ".csv", "2": ".ndjson", "3": ".col"}[formato] + (".gz" if compactar else "")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        caminho = os.path.join(os.path.dirname(sistema.arquivo_dados),
+                               f"pacientes_export_{timestamp}{extensao}")
+
+        if formato == "1":
+            total = exportar_csv(sistema, caminho, compactar=compactar, **filtros)
+        elif formato == "2":
+            total = exportar_ndjson(sistema, caminho, compactar=compactar, **filtros)
+        else:
+            total = exportar_colunar(sistema, caminho, **filtros)
+
+        print(f"{Fore.GREEN}{total} paciente(s) exportado(s) para {caminho}")
+
+    except ValueError as e:
+        print(f"{Fore.RED}Valor inválido: {e}")
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Exportação cancelada")
+    except Exception as e:
+        print(f"{Fore.RED}Erro ao exportar: {e}")
+
+
+def main():
+    """Função principal do módulo"""
+    if not COLORS_AVAILABLE:
+        print("Aviso: colorama não instalado. Execute: pip install colorama\n")
+
+    menu_interativo(SistemaClinica())
+
+
+if __name__ == "__main__":
+    main()
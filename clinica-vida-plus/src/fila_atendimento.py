@@ -21,6 +21,10 @@ except ImportError:
         GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
     class Style:
         BRIGHT = RESET_ALL = ""
+try:
+    from .historico_fila import ENTRADA, SAIDA, HistoricoFila
+except ImportError:
+    from historico_fila import ENTRADA, SAIDA, HistoricoFila
 
 
 class PacienteFila:
@@ -53,10 +57,19 @@ class FilaAtendimento:
     - Normal (prioridade padrão)
     """
 
-    def __init__(self):
+    def __init__(self, historico: Optional[HistoricoFila] = None):
+        """
+        Args:
+            historico: Arquivo de eventos da fila (opcional); quando informado,
+                cada entrada e chamada de paciente é registrada
+        """
         self.fila_emergencia = deque()
         self.fila_preferencial = deque()
         self.fila_normal = deque()
+        self.historico = historico
+        if self.historico is not None:
+            # A fila começa vazia: o histórico não deve herdar a ocupação anterior
+            self.historico.iniciar_sessao()
 
     @staticmethod
     def validar_cpf(cpf: str) -> bool:
@@ -97,17 +110,27 @@ class FilaAtendimento:
         cpf_numeros = re.sub(r'\D', '', cpf)
         cpf_formatado = f"{cpf_numeros[:3]}.{cpf_numeros[3:6]}.{cpf_numeros[6:9]}-{cpf_numeros[9:]}"
 
-        paciente = PacienteFila(nome, cpf_formatado, prioridade)
+        self.adicionar(PacienteFila(nome, cpf_formatado, prioridade))
+
+        print(f"{Fore.GREEN}Paciente {nome} adicionado à fila {prioridade.upper()}")
+        return True
+
+    def adicionar(self, paciente: PacienteFila):
+        """
+        Adiciona um paciente já validado à fila da sua prioridade
 
-        if prioridade == "emergencia":
+        Args:
+            paciente: PacienteFila com CPF já validado e formatado
+        """
+        if paciente.prioridade == "emergencia":
             self.fila_emergencia.append(paciente)
-        elif prioridade == "preferencial":
+        elif paciente.prioridade == "preferencial":
             self.fila_preferencial.append(paciente)
         else:
             self.fila_normal.append(paciente)
 
-        print(f"{Fore.GREEN}Paciente {nome} adicionado à fila {prioridade.upper()}")
-        return True
+        if self.historico is not None:
+            self.historico.registrar(ENTRADA, paciente.prioridade, paciente.cpf)
 
     def remover_proximo(self) -> Optional[PacienteFila]:
         """
@@ -118,12 +141,17 @@ class FilaAtendimento:
             PacienteFila ou None se não houver pacientes
         """
         if self.fila_emergencia:
-            return self.fila_emergencia.popleft()
+            paciente = self.fila_emergencia.popleft()
         elif self.fila_preferencial:
-            return self.fila_preferencial.popleft()
+            paciente = self.fila_preferencial.popleft()
         elif self.fila_normal:
-            return self.fila_normal.popleft()
-        return None
+            paciente = self.fila_normal.popleft()
+        else:
+            return None
+
+        if self.historico is not None:
+            self.historico.registrar(SAIDA, paciente.prioridade, paciente.cpf)
+        return paciente
 
     def mostrar_fila(self):
         """Exibe todos os pacientes nas filas"""
@@ -214,7 +242,9 @@ def demonstracao_algoritmo():
 
 def menu_interativo():
     """Menu interativo para gerenciar a fila de atendimento"""
-    fila = FilaAtendimento()
+    historico = HistoricoFila()
+    historico.iniciar()
+    fila = FilaAtendimento(historico)
 
     while True:
         print(f"\n{Fore.BLUE}{Style.BRIGHT}{'='*60}")
@@ -225,7 +255,8 @@ def menu_interativo():
         print(f"{Fore.WHITE}3. {Fore.CYAN}Mostrar fila completa")
         print(f"{Fore.WHITE}4. {Fore.CYAN}Ver próximo paciente (sem remover)")
         print(f"{Fore.WHITE}5. {Fore.CYAN}Executar demonstração do algoritmo")
-        print(f"{Fore.WHITE}6. {Fore.RED}Voltar")
+        print(f"{Fore.WHITE}6. {Fore.CYAN}Ver histórico da fila")
+        print(f"{Fore.WHITE}7. {Fore.RED}Voltar")
         print(f"{Fore.BLUE}{Style.BRIGHT}{'='*60}")
 
         try:
@@ -283,10 +314,13 @@ def menu_interativo():
                     demonstracao_algoritmo()
 
             elif opcao == "6":
+                historico.exibir_relatorio()
+
+            elif opcao == "7":
                 break
 
             else:
-                print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 6")
+                print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 7")
 
         except KeyboardInterrupt:
             print(f"\n\n{Fore.YELLOW}Programa interrompido pelo usuário")
@@ -294,6 +328,8 @@ def menu_interativo():
         except Exception as e:
             print(f"{Fore.RED}Erro: {e}")
 
+    historico.fechar()
+
 
 def main():
     """Função principal do módulo"""
@@ -0,0 +1,386 @@
+"""
+Histórico da Fila de Atendimento - Clínica Vida+
+Módulo para arquivar e analisar os eventos da fila
+
+Cada entrada e saída da fila vira um evento gravado em formato colunar,
+com um diretório por dia e um arquivo binário por coluna:
+
+    logs/historico_fila/YYYYMMDD/timestamp.bin   (int64, epoch em ms)
+    logs/historico_fila/YYYYMMDD/evento.bin      (int8, ENTRADA, SAIDA ou SESSAO)
+    logs/historico_fila/YYYYMMDD/prioridade.bin  (int8, ver PRIORIDADES)
+    logs/historico_fila/YYYYMMDD/cpf.bin         (int64, dígitos do CPF)
+
+Os eventos ficam em memória e são gravados em lotes por uma thread em
+segundo plano a cada `intervalo` segundos, como na auditoria de acesso.
+Cada fila nova grava um evento SESSAO, pois a fila começa vazia a cada
+execução do programa.
+
+Os relatórios carregam cada coluna direto em um array e agregam números,
+sem interpretar texto; cada dia é lido uma única vez por relatório.
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import atexit
+import os
+import threading
+import time
+from array import array
+from collections import defaultdict, deque
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, Optional, Tuple
+try:
+    from colorama import Fore, Style
+    COLORS_AVAILABLE = True
+except ImportError:
+    COLORS_AVAILABLE = False
+    class Fore:
+        GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
+    class Style:
+        BRIGHT = RESET_ALL = ""
+
+
+ENTRADA = 0
+SAIDA = 1
+SESSAO = 2  # Início de uma fila nova (vazia)
+
+PRIORIDADES = ("emergencia", "preferencial", "normal")
+_CODIGO_PRIORIDADE = {nome: codigo for codigo, nome in enumerate(PRIORIDADES)}
+
+# Coluna -> typecode do array
+COLUNAS = {
+    "timestamp": "q",
+    "evento": "b",
+    "prioridade": "b",
+    "cpf": "q",
+}
+
+
+def _em_ordem_cronologica(colunas: Dict[str, array]) -> Dict[str, array]:
+    """Reordena as colunas de um dia por timestamp, se ainda não estiverem ordenadas"""
+    timestamps = colunas["timestamp"]
+    if all(a <= b for a, b in zip(timestamps, timestamps[1:])):
+        return colunas
+    ordem = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    return {coluna: array(valores.typecode, (valores[i] for i in ordem))
+            for coluna, valores in colunas.items()}
+
+
+def _truncar_colunas(dir_dia: str, linhas: Optional[int] = None) -> int:
+    """
+    Corta os arquivos de coluna de um dia para o mesmo número de linhas
+
+    Args:
+        dir_dia: Diretório do dia
+        linhas: Linhas a manter; None usa a quantidade de linhas completas
+                presentes em todas as colunas
+
+    Returns:
+        int: Número de linhas mantidas
+    """
+    caminhos = {coluna: os.path.join(dir_dia, f"{coluna}.bin") for coluna in COLUNAS}
+    tamanhos = {coluna: (os.path.getsize(caminho) if os.path.exists(caminho) else 0)
+                for coluna, caminho in caminhos.items()}
+    if linhas is None:
+        linhas = min(tamanhos[coluna] // array(tipo).itemsize for coluna, tipo in COLUNAS.items())
+    for coluna, tipo in COLUNAS.items():
+        tamanho = linhas * array(tipo).itemsize
+        if tamanhos[coluna] > tamanho:
+            os.truncate(caminhos[coluna], tamanho)
+    return linhas
+
+
+class HistoricoFila:
+    """
+    Classe que arquiva os eventos da fila e calcula relatórios históricos
+
+    Os eventos ficam em arrays em memória e são anexados aos arquivos do
+    dia pela thread de escrita (após iniciar()) a cada `intervalo` segundos
+    ou a cada `tamanho_lote` eventos, além de em descarregar() e ao
+    encerrar o programa.
+    """
+
+    def __init__(self, diretorio: Optional[str] = None, tamanho_lote: int = 1000,
+                 intervalo: float = 1.0):
+        self.diretorio = diretorio or os.path.join("clinica-vida-plus", "logs", "historico_fila")
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self._pendentes = {coluna: array(tipo) for coluna, tipo in COLUNAS.items()}
+        self._lock = threading.Lock()
+        self._lock_escrita = threading.Lock()
+        self._sinal = threading.Event()
+        self._parar = False
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(self.diretorio, exist_ok=True)
+        atexit.register(self.descarregar)
+
+    def iniciar(self):
+        """Inicia a thread que grava os eventos periodicamente"""
+        if self._thread is not None:
+            return
+        self._parar = False
+        self._thread = threading.Thread(target=self._executar, name="historico-fila", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def fechar(self):
+        """Para a thread de escrita e grava o que restar"""
+        if self._thread is not None:
+            self._parar = True
+            self._sinal.set()
+            self._thread.join()
+            self._thread = None
+        self.descarregar()
+
+    def _executar(self):
+        """Laço da thread de escrita"""
+        while not self._parar:
+            self._sinal.wait(self.intervalo)
+            self._sinal.clear()
+            try:
+                self.descarregar()
+            except Exception as e:
+                print(f"{Fore.RED}Erro ao gravar histórico da fila: {e}")
+
+    def iniciar_sessao(self, momento: Optional[float] = None):
+        """
+        Marca o início de uma fila nova, que começa vazia
+
+        Pacientes que ficaram na fila de uma execução anterior não contam
+        na ocupação nem nas esperas a partir deste ponto.
+        """
+        self.registrar(SESSAO, "normal", "", momento)
+
+    def registrar(self, evento: int, prioridade: str, cpf: str, momento: Optional[float] = None):
+        """
+        Registra um evento da fila
+
+        Args:
+            evento: ENTRADA ou SAIDA
+            prioridade: "emergencia", "preferencial" ou "normal"
+            cpf: CPF do paciente (com ou sem formatação)
+            momento: Epoch em segundos (padrão: agora)
+        """
+        digitos = "".join(c for c in cpf if c.isdigit())
+        with self._lock:
+            pendentes = self._pendentes
+            pendentes["timestamp"].append(int((time.time() if momento is None else momento) * 1000))
+            pendentes["evento"].append(evento)
+            pendentes["prioridade"].append(_CODIGO_PRIORIDADE.get(prioridade, _CODIGO_PRIORIDADE["normal"]))
+            pendentes["cpf"].append(int(digitos) if digitos else -1)
+            cheio = len(pendentes["timestamp"]) >= self.tamanho_lote
+
+        if cheio:
+            if self._thread is not None:
+                self._sinal.set()
+            else:
+                self.descarregar()
+
+    def descarregar(self):
+        """Anexa os eventos pendentes aos arquivos de cada dia"""
+        with self._lock_escrita:
+            with self._lock:
+                pendentes = self._pendentes
+                if not pendentes["timestamp"]:
+                    return
+                self._pendentes = {coluna: array(tipo) for coluna, tipo in COLUNAS.items()}
+            self._gravar(pendentes)
+
+    def _devolver(self, eventos: Dict[str, array]):
+        """Recoloca antes dos pendentes eventos que não puderam ser gravados"""
+        with self._lock:
+            for coluna, valores in eventos.items():
+                self._pendentes[coluna] = valores + self._pendentes[coluna]
+
+    def _gravar(self, pendentes: Dict[str, array]):
+        """
+        Grava um lote de eventos, separando por dia
+
+        As colunas de um dia são anexadas uma após a outra. Antes de anexar,
+        todas voltam ao número de linhas completas; se uma delas falhar, as
+        colunas voltam a esse tamanho e os eventos do dia e dos seguintes
+        voltam aos pendentes antes de a exceção ser propagada.
+        """
+
+        # Separa as posições por dia; normalmente todas caem no mesmo dia
+        por_dia: Dict[str, list] = defaultdict(list)
+        for i, ms in enumerate(pendentes["timestamp"]):
+            por_dia[datetime.fromtimestamp(ms / 1000).strftime("%Y%m%d")].append(i)
+
+        dias = list(por_dia)
+        for numero, dia in enumerate(dias):
+            posicoes = por_dia[dia]
+            dir_dia = os.path.join(self.diretorio, dia)
+            os.makedirs(dir_dia, exist_ok=True)
+            linhas = _truncar_colunas(dir_dia)
+            try:
+                for coluna, tipo in COLUNAS.items():
+                    valores = pendentes[coluna]
+                    if len(posicoes) != len(valores):
+                        valores = array(tipo, (valores[i] for i in posicoes))
+                    with open(os.path.join(dir_dia, f"{coluna}.bin"), 'ab') as f:
+                        valores.tofile(f)
+            except Exception:
+                try:
+                    _truncar_colunas(dir_dia, linhas)
+                except OSError:
+                    pass
+                restantes = [i for pendente in dias[numero:] for i in por_dia[pendente]]
+                self._devolver({coluna: array(tipo, (pendentes[coluna][i] for i in restantes))
+                                for coluna, tipo in COLUNAS.items()})
+                raise
+
+    def ler_dia(self, dia: date) -> Dict[str, array]:
+        """
+        Lê todas as colunas de um dia
+
+        Bytes de um evento incompleto e linhas que não existem em todas as
+        colunas (gravação interrompida) são ignorados, para que as colunas
+        continuem alinhadas.
+
+        Args:
+            dia: Dia desejado
+
+        Returns:
+            Dicionário coluna -> array (vazio se não houver eventos)
+        """
+        dir_dia = os.path.join(self.diretorio, dia.strftime("%Y%m%d"))
+        colunas = {}
+        for coluna, tipo in COLUNAS.items():
+            valores = array(tipo)
+            caminho = os.path.join(dir_dia, f"{coluna}.bin")
+            if os.path.exists(caminho):
+                with open(caminho, 'rb') as f:
+                    dados = f.read()
+                valores.frombytes(dados[:len(dados) - len(dados) % valores.itemsize])
+            colunas[coluna] = valores
+
+        linhas = min(len(valores) for valores in colunas.values())
+        for coluna, valores in colunas.items():
+            if len(valores) > linhas:
+                del valores[linhas:]
+        return colunas
+
+    def _dias(self, inicio: date, fim: date) -> Iterator[Tuple[date, Dict[str, array]]]:
+        """Percorre os dias arquivados entre inicio e fim (inclusivo)"""
+        self.descarregar()
+        if not os.path.isdir(self.diretorio):
+            return
+        for nome in sorted(os.listdir(self.diretorio)):
+            try:
+                dia = datetime.strptime(nome, "%Y%m%d").date()
+            except ValueError:
+                continue
+            if inicio <= dia <= fim:
+                yield dia, _em_ordem_cronologica(self.ler_dia(dia))
+
+    def resumo(self, inicio: date, fim: date) -> Dict:
+        """
+        Calcula todas as métricas do período lendo cada dia uma única vez
+
+        A ocupação da fila é reconstruída somando entradas e subtraindo
+        saídas na ordem dos eventos. Ela recomeça em zero a cada dia e a
+        cada evento SESSAO, assim como o pareamento das esperas: entradas e
+        saídas são pareadas por CPF e prioridade, na ordem em que
+        aconteceram, e entradas sem saída são ignoradas.
+
+        Returns:
+            Dicionário com:
+            - "pacientes_por_hora": hora (0 a 23) -> entradas na fila
+            - "espera_media": prioridade -> espera média em minutos (None sem dados)
+            - "pico": (momento, pacientes na fila) ou None se não houver eventos
+        """
+        horas = [0] * 24
+        soma = [0] * len(PRIORIDADES)
+        quantidade = [0] * len(PRIORIDADES)
+        melhor: Optional[Tuple[int, int]] = None
+
+        for dia, colunas in self._dias(inicio, fim):
+            meia_noite_ms = int(datetime.combine(dia, datetime.min.time()).timestamp() * 1000)
+            ocupacao = 0
+            abertas: Dict[Tuple[int, int], deque] = defaultdict(deque)
+            for ms, evento, prioridade, cpf in zip(colunas["timestamp"], colunas["evento"],
+                                                   colunas["prioridade"], colunas["cpf"]):
+                if evento == SESSAO:
+                    ocupacao = 0
+                    abertas.clear()
+                    continue
+
+                chave = (cpf, prioridade)
+                if evento == ENTRADA:
+                    horas[min(23, max(0, (ms - meia_noite_ms) // 3600000))] += 1
+                    abertas[chave].append(ms)
+                    ocupacao += 1
+                    if melhor is None or ocupacao > melhor[1]:
+                        melhor = (ms, ocupacao)
+                else:
+                    if abertas[chave]:
+                        soma[prioridade] += ms - abertas[chave].popleft()
+                        quantidade[prioridade] += 1
+                    ocupacao = max(0, ocupacao - 1)
+
+        return {
+            "pacientes_por_hora": dict(enumerate(horas)),
+            "espera_media": {nome: (soma[i] / quantidade[i] / 60000 if quantidade[i] else None)
+                             for i, nome in enumerate(PRIORIDADES)},
+            "pico": (datetime.fromtimestamp(melhor[0] / 1000), melhor[1]) if melhor else None,
+        }
+
+    def pacientes_por_hora(self, inicio: date, fim: date) -> Dict[int, int]:
+        """
+        Conta entradas na fila por hora do dia no período
+
+        Returns:
+            Dicionário hora (0 a 23) -> quantidade de pacientes
+        """
+        return self.resumo(inicio, fim)["pacientes_por_hora"]
+
+    def espera_media_por_prioridade(self, inicio: date, fim: date) -> Dict[str, Optional[float]]:
+        """
+        Calcula a espera média (em minutos) entre entrada e chamada por prioridade
+
+        Returns:
+            Dicionário prioridade -> espera média em minutos (None sem dados)
+        """
+        return self.resumo(inicio, fim)["espera_media"]
+
+    def pico(self, inicio: date, fim: date) -> Optional[Tuple[datetime, int]]:
+        """
+        Encontra o momento de maior ocupação da fila no período
+
+        Returns:
+            Tupla (momento, pacientes na fila) ou None se não houver eventos
+        """
+        return self.resumo(inicio, fim)["pico"]
+
+    def exibir_relatorio(self, dias: int = 30):
+        """
+        Exibe o relatório histórico dos últimos dias
+
+        Args:
+            dias: Quantidade de dias (incluindo hoje)
+        """
+        fim = date.today()
+        inicio = fim - timedelta(days=dias - 1)
+
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}=== HISTÓRICO DA FILA (últimos {dias} dias) ===")
+
+        resumo = self.resumo(inicio, fim)
+        pico = resumo["pico"]
+        if pico is None:
+            print(f"{Fore.YELLOW}Nenhum evento registrado no período")
+            return
+
+        print(f"{Fore.WHITE}Pico de ocupação: {Fore.GREEN}{pico[1]} paciente(s) "
+              f"em {pico[0].strftime('%d/%m/%Y %H:%M')}")
+
+        print(f"\n{Fore.WHITE}Espera média por prioridade:")
+        for prioridade, media in resumo["espera_media"].items():
+            valor = f"{media:.1f} min" if media is not None else "sem dados"
+            print(f"{Fore.WHITE}  {prioridade.upper():<13}: {Fore.GREEN}{valor}")
+
+        print(f"\n{Fore.WHITE}Pacientes por hora:")
+        for hora, quantidade in resumo["pacientes_por_hora"].items():
+            if quantidade:
+                print(f"{Fore.WHITE}  {hora:02d}h: {Fore.GREEN}{quantidade:>5} {'█' * min(quantidade, 40)}")
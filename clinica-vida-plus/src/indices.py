@@ -0,0 +1,478 @@
+"""
+Índices em Memória - Clínica Vida+
+Módulo com índices auxiliares sobre o cadastro de pacientes
+
+Os índices são mantidos pelo SistemaClinica a cada cadastro e a cada
+carregamento, permitindo consultas e relatórios sem percorrer toda a
+lista de pacientes.
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import heapq
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Faixas etárias usadas nos relatórios: (rótulo, idade mínima, idade máxima)
+FAIXAS_ETARIAS: Sequence[Tuple[str, int, int]] = (
+    ("0-17", 0, 17),
+    ("18-29", 18, 29),
+    ("30-44", 30, 44),
+    ("45-59", 45, 59),
+    ("60+", 60, 149),
+)
+
+# Timestamp dos cadastros cuja data não pôde ser interpretada
+SEM_DATA = 0
+
+
+@lru_cache(maxsize=65536)
+def inicio_do_bloco(bloco: int) -> Tuple[datetime, str]:
+    """
+    Início, no horário local, de um bloco de 15 minutos (epoch // 900)
+
+    Fusos e mudanças de horário de verão sempre caem em múltiplos de 15
+    minutos, então todo o bloco tem a mesma data e hora locais e basta
+    converter cada bloco uma vez. Usado pelos contadores do IndiceCadastro
+    e pela formatação de Paciente.data_cadastro.
+
+    Returns:
+        Tupla com o início do bloco e o seu prefixo 'YYYY-MM-DD HH:'
+    """
+    momento = datetime.fromtimestamp(bloco * 900)
+    return momento, momento.strftime("%Y-%m-%d %H:")
+
+
+def contar_por_dia_e_hora(timestamps: Iterable[int]) -> Tuple[Counter, Counter]:
+    """
+    Conta cadastros por dia e por hora local, ignorando os SEM_DATA
+
+    Args:
+        timestamps: Epochs de cadastro
+
+    Returns:
+        Tupla (Counter dia -> quantidade, Counter início da hora -> quantidade)
+    """
+    por_dia: Counter = Counter()
+    por_hora: Counter = Counter()
+    for bloco, quantidade in Counter(t // 900 for t in timestamps if t != SEM_DATA).items():
+        momento = inicio_do_bloco(bloco)[0]
+        por_dia[momento.date()] += quantidade
+        por_hora[momento.replace(minute=0)] += quantidade
+    return por_dia, por_hora
+
+
+class IndiceIdade:
+    """
+    Índice de pacientes por idade baseado em contagem
+
+    Como a idade é limitada (0 a IDADE_MAXIMA), o índice guarda um balde
+    por idade. Contagens por intervalo, percentis e histogramas custam no
+    máximo IDADE_MAXIMA passos, independentemente do número de pacientes,
+    e inserções são O(1).
+    """
+
+    IDADE_MAXIMA = 149
+
+    def __init__(self, pacientes: Iterable = ()):
+        self._baldes: List[List] = [[] for _ in range(self.IDADE_MAXIMA + 1)]
+        self.total = 0
+        self.soma_idades = 0
+        # Mesmo efeito de adicionar() para cada paciente, sem o acesso aos atributos
+        baldes, posicao = self._baldes, self._posicao
+        for paciente in pacientes:
+            idade = paciente.idade
+            baldes[posicao(idade)].append(paciente)
+            self.total += 1
+            self.soma_idades += idade
+
+    def _posicao(self, idade: int) -> int:
+        """Limita a idade ao intervalo coberto pelo índice"""
+        return min(max(int(idade), 0), self.IDADE_MAXIMA)
+
+    def adicionar(self, paciente):
+        """Adiciona um paciente ao índice"""
+        self._baldes[self._posicao(paciente.idade)].append(paciente)
+        self.total += 1
+        self.soma_idades += paciente.idade
+
+    def contar_intervalo(self, idade_min: int = 0, idade_max: int = IDADE_MAXIMA) -> int:
+        """
+        Conta pacientes com idade entre idade_min e idade_max (inclusivo)
+
+        Args:
+            idade_min: Idade mínima
+            idade_max: Idade máxima
+
+        Returns:
+            int: Quantidade de pacientes no intervalo
+        """
+        inicio, fim = self._posicao(idade_min), self._posicao(idade_max)
+        return sum(len(self._baldes[i]) for i in range(inicio, fim + 1))
+
+    def pacientes_intervalo(self, idade_min: int = 0, idade_max: int = IDADE_MAXIMA) -> List:
+        """
+        Retorna os pacientes com idade entre idade_min e idade_max (inclusivo)
+
+        Returns:
+            Lista de pacientes ordenada por idade (e por ordem de cadastro)
+        """
+        inicio, fim = self._posicao(idade_min), self._posicao(idade_max)
+        encontrados = []
+        for i in range(inicio, fim + 1):
+            encontrados.extend(self._baldes[i])
+        return encontrados
+
+    def percentil(self, p: float) -> Optional[int]:
+        """
+        Calcula o percentil de idade pelo método do posto mais próximo
+
+        Args:
+            p: Percentil entre 0 e 100 (50 = mediana)
+
+        Returns:
+            Idade no percentil ou None se não houver pacientes
+        """
+        if self.total == 0:
+            return None
+        # Posto 1-based do paciente no percentil pedido (teto de p/100 * total)
+        posto = max(1, -(-self.total * p // 100))
+        acumulado = 0
+        for idade, balde in enumerate(self._baldes):
+            acumulado += len(balde)
+            if acumulado >= posto:
+                return idade
+        return self.IDADE_MAXIMA
+
+    def histograma(self, faixas: Sequence[Tuple[str, int, int]] = FAIXAS_ETARIAS) -> Dict[str, int]:
+        """
+        Conta pacientes por faixa etária
+
+        Args:
+            faixas: Sequência de (rótulo, idade mínima, idade máxima)
+
+        Returns:
+            Dicionário rótulo -> quantidade de pacientes
+        """
+        return {rotulo: self.contar_intervalo(minima, maxima) for rotulo, minima, maxima in faixas}
+
+    def mais_novo(self):
+        """Retorna o primeiro paciente cadastrado com a menor idade"""
+        for balde in self._baldes:
+            if balde:
+                return balde[0]
+        return None
+
+    def mais_velho(self):
+        """Retorna o primeiro paciente cadastrado com a maior idade"""
+        for balde in reversed(self._baldes):
+            if balde:
+                return balde[0]
+        return None
+
+    def media(self) -> Optional[float]:
+        """Retorna a idade média ou None se não houver pacientes"""
+        return self.soma_idades / self.total if self.total else None
+
+
+class IndiceCadastro:
+    """
+    Índice de pacientes por data de cadastro
+
+    Mantém os timestamps de cadastro ordenados (com os pacientes em uma
+    lista paralela) para buscas por período com bisect, e contadores
+    pré-agregados por dia e por hora para relatórios de tendência.
+    Cadastros novos chegam em ordem cronológica, então a inserção
+    normalmente é um simples append. Cadastros com data inválida (SEM_DATA)
+    ficam fora das buscas por período e dos contadores, em `sem_data`.
+    """
+
+    def __init__(self, pacientes: Iterable = (), contagens: Optional[Tuple[Counter, Counter]] = None,
+                 ordenados: bool = False):
+        """
+        Args:
+            pacientes: Pacientes a indexar
+            contagens: Contagens por dia e por hora (ver contar_por_dia_e_hora)
+                       já calculadas, por exemplo nos processos do carregamento
+                       por partições; se omitidas, são calculadas aqui
+            ordenados: Se True, pacientes já está em ordem de cadastro e não
+                       é reordenado
+        """
+        if ordenados:
+            lista = list(pacientes)
+        else:
+            lista = sorted(pacientes, key=attrgetter("timestamp_cadastro"))
+        self._timestamps: List[int] = list(map(attrgetter("timestamp_cadastro"), lista))
+        self._pacientes: List = lista
+        a, b = bisect_left(self._timestamps, SEM_DATA), bisect_right(self._timestamps, SEM_DATA)
+        self.sem_data: List = lista[a:b]
+        if b > a:
+            del self._timestamps[a:b]
+            del self._pacientes[a:b]
+        if contagens is None:
+            contagens = contar_por_dia_e_hora(self._timestamps)
+        self.por_dia, self.por_hora = contagens
+
+    def _contar(self, bloco: int, quantidade: int = 1):
+        """Soma cadastros de um bloco de 15 minutos aos contadores por dia e por hora"""
+        momento = inicio_do_bloco(bloco)[0]
+        self.por_dia[momento.date()] += quantidade
+        self.por_hora[momento.replace(minute=0)] += quantidade
+
+    def adicionar(self, paciente):
+        """Adiciona um paciente ao índice"""
+        timestamp = paciente.timestamp_cadastro
+        if timestamp == SEM_DATA:
+            self.sem_data.append(paciente)
+            return
+        if not self._timestamps or timestamp >= self._timestamps[-1]:
+            self._timestamps.append(timestamp)
+            self._pacientes.append(paciente)
+        else:
+            posicao = bisect_right(self._timestamps, timestamp)
+            self._timestamps.insert(posicao, timestamp)
+            self._pacientes.insert(posicao, paciente)
+        self._contar(timestamp // 900)
+
+    def _intervalo(self, inicio: datetime, fim: datetime) -> Tuple[int, int]:
+        """Posições dos cadastros em [inicio, fim)"""
+        return (bisect_left(self._timestamps, inicio.timestamp()),
+                bisect_left(self._timestamps, fim.timestamp()))
+
+    def pacientes_periodo(self, inicio: datetime, fim: datetime) -> List:
+        """
+        Retorna os pacientes cadastrados no período [inicio, fim)
+
+        Returns:
+            Lista de pacientes em ordem de cadastro
+        """
+        a, b = self._intervalo(inicio, fim)
+        return self._pacientes[a:b]
+
+    def iterar_periodo(self, inicio: datetime, fim: datetime) -> Iterator:
+        """
+        Percorre os pacientes cadastrados no período [inicio, fim) sem copiar a lista
+
+        Yields:
+            Pacientes em ordem de cadastro
+        """
+        a, b = self._intervalo(inicio, fim)
+        pacientes = self._pacientes
+        return (pacientes[i] for i in range(a, b))
+
+    def contar_periodo(self, inicio: datetime, fim: datetime) -> int:
+        """Conta os pacientes cadastrados no período [inicio, fim)"""
+        a, b = self._intervalo(inicio, fim)
+        return b - a
+
+    def contagem_por_dia(self, inicio: Optional[date] = None,
+                         fim: Optional[date] = None) -> Dict[date, int]:
+        """
+        Retorna os cadastros por dia, em ordem cronológica
+
+        Args:
+            inicio: Primeiro dia (inclusivo); None não limita
+            fim: Último dia (inclusivo); None não limita
+
+        Returns:
+            Dicionário dia -> quantidade (apenas dias com cadastros)
+        """
+        return {dia: quantidade for dia, quantidade in sorted(self.por_dia.items())
+                if (inicio is None or dia >= inicio) and (fim is None or dia <= fim)}
+
+    def contagem_por_hora_do_dia(self) -> Dict[int, int]:
+        """
+        Retorna os cadastros agrupados pela hora do dia (0 a 23)
+
+        Returns:
+            Dicionário hora -> quantidade, somando todos os dias
+        """
+        horas = {hora: 0 for hora in range(24)}
+        for momento, quantidade in self.por_hora.items():
+            horas[momento.hour] += quantidade
+        return horas
+
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Remove acentos e converte para minúsculas ("João" -> "joao")
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        str: Texto sem marcas diacríticas e em minúsculas
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+# Nomes repetem muito as mesmas palavras, então a normalização é memorizada
+_normalizar_palavra = lru_cache(maxsize=65536)(normalizar_texto)
+
+
+def distancia_edicao(a: str, b: str, limite: int) -> int:
+    """
+    Distância de Levenshtein entre a e b, limitada
+
+    Para assim que a distância certamente ultrapassa o limite.
+
+    Args:
+        a: Primeira palavra
+        b: Segunda palavra
+        limite: Maior distância de interesse
+
+    Returns:
+        int: Distância exata, ou limite + 1 se ela for maior que o limite
+    """
+    if abs(len(a) - len(b)) > limite:
+        return limite + 1
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        atual = [i]
+        for j, cb in enumerate(b, 1):
+            atual.append(min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + (ca != cb)))
+        if min(atual) > limite:
+            return limite + 1
+        anterior = atual
+    return min(anterior[-1], limite + 1)
+
+
+class ArvoreBK:
+    """
+    BK-tree de palavras para busca por distância de edição
+
+    Cada nó guarda uma palavra e filhos indexados pela distância até ela;
+    pela desigualdade triangular, uma busca com tolerância d só precisa
+    visitar os filhos com distância entre (dist - d) e (dist + d).
+    """
+
+    # Limite usado ao inserir; maior que qualquer palavra de um nome
+    _LIMITE_INSERCAO = 64
+
+    def __init__(self):
+        self._raiz: Optional[Tuple[str, Dict[int, tuple]]] = None
+
+    def adicionar(self, palavra: str):
+        """Adiciona uma palavra (palavras repetidas são ignoradas)"""
+        if self._raiz is None:
+            self._raiz = (palavra, {})
+            return
+        no = self._raiz
+        while True:
+            distancia = distancia_edicao(palavra, no[0], self._LIMITE_INSERCAO)
+            if distancia == 0:
+                return
+            filho = no[1].get(distancia)
+            if filho is None:
+                no[1][distancia] = (palavra, {})
+                return
+            no = filho
+
+    def buscar(self, palavra: str, tolerancia: int) -> List[Tuple[str, int]]:
+        """
+        Retorna as palavras a no máximo `tolerancia` edições de distância
+
+        Returns:
+            Lista de (palavra, distância)
+        """
+        if self._raiz is None:
+            return []
+        encontradas = []
+        pendentes = [self._raiz]
+        while pendentes:
+            termo, filhos = pendentes.pop()
+            distancia = distancia_edicao(palavra, termo, self._LIMITE_INSERCAO)
+            if distancia <= tolerancia:
+                encontradas.append((termo, distancia))
+            for d in range(max(1, distancia - tolerancia), distancia + tolerancia + 1):
+                filho = filhos.get(d)
+                if filho is not None:
+                    pendentes.append(filho)
+        return encontradas
+
+
+class IndiceNomes:
+    """
+    Índice de nomes para busca tolerante a acentos e erros de digitação
+
+    Cada nome é normalizado (sem acentos, minúsculo) e dividido em palavras.
+    O vocabulário de palavras distintas fica em uma BK-tree e cada palavra
+    aponta para os pacientes que a contêm. Como o vocabulário de nomes é
+    muito menor que o número de pacientes, a busca aproximada percorre
+    apenas uma pequena parte da árvore.
+    """
+
+    def __init__(self, pacientes: Iterable = ()):
+        self._pacientes: List = []
+        self._ocorrencias: Dict[str, List[int]] = {}
+        self._arvore = ArvoreBK()
+        for paciente in pacientes:
+            self.adicionar(paciente)
+
+    def adicionar(self, paciente):
+        """Adiciona um paciente ao índice"""
+        posicao = len(self._pacientes)
+        self._pacientes.append(paciente)
+        for palavra in {_normalizar_palavra(p) for p in paciente.nome.split()}:
+            ocorrencias = self._ocorrencias.get(palavra)
+            if ocorrencias is None:
+                self._ocorrencias[palavra] = [posicao]
+                self._arvore.adicionar(palavra)
+            else:
+                ocorrencias.append(posicao)
+
+    @staticmethod
+    def tolerancia(palavra: str) -> int:
+        """Erros de digitação aceitos conforme o tamanho da palavra"""
+        if len(palavra) <= 2:
+            return 0
+        if len(palavra) <= 5:
+            return 1
+        return 2
+
+    def buscar(self, busca: str, limite: int = 10) -> List[Tuple[object, float]]:
+        """
+        Busca pacientes cujo nome contém palavras parecidas com as buscadas
+
+        Todas as palavras da busca precisam corresponder a alguma palavra do
+        nome. Os resultados são ordenados pela soma das distâncias de edição.
+
+        Args:
+            busca: Texto buscado (acentos e maiúsculas são ignorados)
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Lista de (paciente, similaridade entre 0 e 1), mais similares primeiro
+        """
+        palavras = normalizar_texto(busca).split()
+        if not palavras:
+            return []
+
+        distancias: Optional[Dict[int, int]] = None
+        for palavra in palavras:
+            # Menor distância desta palavra da busca para cada paciente
+            por_paciente: Dict[int, int] = {}
+            for termo, distancia in sorted(self._arvore.buscar(palavra, self.tolerancia(palavra)),
+                                           key=lambda item: item[1]):
+                for posicao in self._ocorrencias[termo]:
+                    por_paciente.setdefault(posicao, distancia)
+
+            if distancias is None:
+                distancias = por_paciente
+            else:
+                distancias = {posicao: distancia + por_paciente[posicao]
+                              for posicao, distancia in distancias.items() if posicao in por_paciente}
+            if not distancias:
+                return []
+
+        total_letras = sum(len(p) for p in palavras)
+        melhores = heapq.nsmallest(limite, distancias.items(),
+                                   key=lambda item: (item[1], len(self._pacientes[item[0]].nome), item[0]))
+        return [(self._pacientes[posicao], 1 - distancia / total_letras) for posicao, distancia in melhores]
@@ -0,0 +1,167 @@
+"""
+Sistema de Instrumentação - Clínica Vida+
+Módulo para medir o tempo das operações do sistema
+
+A instrumentação é opcional e controlada por variáveis de ambiente,
+lidas uma única vez na importação:
+
+- CLINICA_PERFIL=1: mede cada operação decorada com @instrumentar e
+  imprime um resumo (contagem e distribuição de latência) ao sair
+- CLINICA_PERFIL_CPROFILE=<diretório>: além de medir, executa cada
+  chamada sob cProfile e grava as estatísticas em <diretório>. Só um
+  cProfile roda por vez; chamadas que começam enquanto outra está sendo
+  perfilada (por exemplo, o carregamento em segundo plano) são apenas
+  medidas
+
+Com as variáveis ausentes, @instrumentar devolve a própria função,
+sem nenhum custo adicional por chamada.
+
+Author: Sistema Clínica Vida+
+Date: 2025-10-15
+"""
+
+import atexit
+import cProfile
+import functools
+import os
+import pstats
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+try:
+    from colorama import Fore, Style
+    COLORS_AVAILABLE = True
+except ImportError:
+    COLORS_AVAILABLE = False
+    class Fore:
+        GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
+    class Style:
+        BRIGHT = RESET_ALL = ""
+
+
+DIR_CPROFILE = os.environ.get("CLINICA_PERFIL_CPROFILE", "")
+ATIVO = os.environ.get("CLINICA_PERFIL", "") not in ("", "0") or bool(DIR_CPROFILE)
+
+# Latências em segundos por nome de operação
+_medicoes: Dict[str, List[float]] = {}
+
+# Livre quando nenhum cProfile está rodando. A partir do Python 3.12 o cProfile
+# usa um único identificador global do sys.monitoring, e um segundo perfil
+# simultâneo (em outra thread ou aninhado) falha com ValueError
+_lock_cprofile = threading.Lock()
+
+
+def instrumentar(nome: str) -> Callable[[Callable], Callable]:
+    """
+    Decorador que mede o tempo de uma operação quando a instrumentação está ativa
+
+    Args:
+        nome: Nome da operação no resumo
+
+    Returns:
+        Decorador; com a instrumentação desativada, devolve a função original
+    """
+    def decorador(funcao: Callable) -> Callable:
+        if not ATIVO:
+            return funcao
+
+        latencias = _medicoes.setdefault(nome, [])
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if DIR_CPROFILE:
+                arquivo = os.path.join(DIR_CPROFILE, f"{nome}_{len(latencias) + 1}.prof")
+                inicio = time.perf_counter()
+                try:
+                    return perfilar(funcao, *args, arquivo=arquivo, **kwargs)
+                finally:
+                    latencias.append(time.perf_counter() - inicio)
+
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                latencias.append(time.perf_counter() - inicio)
+
+        return envolvida
+
+    return decorador
+
+
+def perfilar(funcao: Callable, *args, arquivo: Optional[str] = None, **kwargs) -> Any:
+    """
+    Executa uma chamada sob cProfile
+
+    Se outra chamada já estiver sendo perfilada, esta apenas executa a
+    função, sem gerar estatísticas.
+
+    Args:
+        funcao: Função a executar
+        arquivo: Caminho para gravar as estatísticas (formato pstats);
+                 se omitido, as 20 funções mais caras são impressas
+
+    Returns:
+        O retorno da própria função
+    """
+    if not _lock_cprofile.acquire(blocking=False):
+        return funcao(*args, **kwargs)
+    try:
+        perfil = cProfile.Profile()
+        try:
+            return perfil.runcall(funcao, *args, **kwargs)
+        finally:
+            if arquivo:
+                os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+                perfil.dump_stats(arquivo)
+            else:
+                pstats.Stats(perfil).sort_stats("cumulative").print_stats(20)
+    finally:
+        _lock_cprofile.release()
+
+
+def _percentil(ordenadas: List[float], p: float) -> float:
+    """Percentil por vizinho mais próximo de uma lista ordenada"""
+    indice = min(len(ordenadas) - 1, max(0, round(p / 100 * len(ordenadas)) - 1))
+    return ordenadas[indice]
+
+
+def obter_resumo() -> Dict[str, Dict[str, float]]:
+    """
+    Calcula o resumo das medições feitas até agora
+
+    Returns:
+        Dicionário por operação com contagem, total, média, p50, p95 e máximo
+        (tempos em milissegundos)
+    """
+    resumo = {}
+    for nome, latencias in _medicoes.items():
+        if not latencias:
+            continue
+        ordenadas = sorted(latencias)
+        resumo[nome] = {
+            "contagem": len(ordenadas),
+            "total_ms": sum(ordenadas) * 1000,
+            "media_ms": sum(ordenadas) / len(ordenadas) * 1000,
+            "p50_ms": _percentil(ordenadas, 50) * 1000,
+            "p95_ms": _percentil(ordenadas, 95) * 1000,
+            "max_ms": ordenadas[-1] * 1000
+        }
+    return resumo
+
+
+def exibir_resumo():
+    """Exibe o resumo das medições no console"""
+    resumo = obter_resumo()
+    if not resumo:
+        return
+
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}=== PERFIL DE DESEMPENHO ===")
+    print(f"{Fore.WHITE}{'Operação':<20} {'Qtd':>6} {'Média':>10} {'p50':>10} {'p95':>10} {'Máx':>10}")
+    print(f"{'-'*70}")
+    for nome, m in sorted(resumo.items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"{Fore.WHITE}{nome:<20} {m['contagem']:>6} {m['media_ms']:>8.2f}ms "
+              f"{m['p50_ms']:>8.2f}ms {m['p95_ms']:>8.2f}ms {m['max_ms']:>8.2f}ms")
+
+
+if ATIVO:
+    atexit.register(exibir_resumo)
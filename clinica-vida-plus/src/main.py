@@ -6,11 +6,21 @@ Author: Sistema Clínica Vida+
 Date: 2025-09-15
 """
 
+import gc
 import json
 import os
 import re
-from datetime import datetime
-from typing import List, Dict, Optional
+import shutil
+import threading
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter, itemgetter, mul
+from typing import List, Dict, Optional, Tuple
 try:
     from colorama import init, Fore, Style
     init(autoreset=True)
@@ -22,6 +32,99 @@ except ImportError:
         GREEN = CYAN = YELLOW = RED = MAGENTA = BLUE = WHITE = ""
     class Style:
         BRIGHT = RESET_ALL = ""
+try:
+    from .indices import (FAIXAS_ETARIAS, IndiceCadastro, IndiceIdade, IndiceNomes,
+                          SEM_DATA, contar_por_dia_e_hora, inicio_do_bloco)
+    from .instrumentacao import instrumentar
+except ImportError:
+    from indices import (FAIXAS_ETARIAS, IndiceCadastro, IndiceIdade, IndiceNomes,
+                         SEM_DATA, contar_por_dia_e_hora, inicio_do_bloco)
+    from instrumentacao import instrumentar
+
+
+# Formatos aceitos além do ISO (YYYY-MM-DD[ HH:MM:SS]) ao ler a data de cadastro
+FORMATOS_DATA_CADASTRO = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y")
+
+
+def _interpretar_data(valor) -> Optional[datetime]:
+    """Interpreta uma data de cadastro; retorna None se não for possível"""
+    if not isinstance(valor, str):
+        return None
+    try:
+        return datetime.fromisoformat(valor.strip())
+    except ValueError:
+        pass
+    for formato in FORMATOS_DATA_CADASTRO:
+        try:
+            return datetime.strptime(valor.strip(), formato)
+        except ValueError:
+            continue
+    return None
+
+
+# Minutos e segundos válidos no formato canônico -> valor
+_DOIS_DIGITOS = {f"{i:02d}": i for i in range(60)}
+
+
+@lru_cache(maxsize=65536)
+def _inicio_hora(prefixo: str) -> Optional[int]:
+    """
+    Epoch do início de uma hora local no formato 'YYYY-MM-DD HH:'
+
+    Returns:
+        Epoch em segundos, ou None se o texto não estiver no formato canônico
+        ou se a hora não existir inteira no horário local (mudança de
+        horário de verão), casos tratados por _ler_data_cadastro
+    """
+    try:
+        momento = datetime.strptime(prefixo, "%Y-%m-%d %H:")
+    except ValueError:
+        return None
+    if momento.strftime("%Y-%m-%d %H:") != prefixo:
+        return None
+    inicio = int(momento.timestamp())
+    if (datetime.fromtimestamp(inicio) != momento or
+            datetime.fromtimestamp(inicio + 3599) != momento.replace(minute=59, second=59)):
+        return None
+    return inicio
+
+
+def _formatar_data(timestamp: int) -> str:
+    """Formata um epoch como YYYY-MM-DD HH:MM:SS no horário local"""
+    bloco, resto = divmod(timestamp, 900)
+    momento, prefixo = inicio_do_bloco(bloco)
+    return f"{prefixo}{momento.minute + resto // 60:02d}:{resto % 60:02d}"
+
+
+def _ler_data_cadastro(valor) -> Tuple[int, Optional[str]]:
+    """
+    Converte o texto de uma data de cadastro para epoch
+
+    Textos no formato canônico usam o início da hora memorizado; os demais
+    passam por _interpretar_data.
+
+    Returns:
+        Tupla (timestamp, texto original ou None se a formatação do
+        timestamp reproduz o texto exatamente)
+    """
+    if isinstance(valor, str) and len(valor) == 19 and valor[16] == ":":
+        inicio = _inicio_hora(valor[:14])
+        minuto = _DOIS_DIGITOS.get(valor[14:16])
+        segundo = _DOIS_DIGITOS.get(valor[17:])
+        if inicio is not None and minuto is not None and segundo is not None:
+            return inicio + minuto * 60 + segundo, None
+
+    momento = _interpretar_data(valor)
+    timestamp = int(momento.timestamp()) if momento is not None else SEM_DATA
+    return timestamp, (None if _formatar_data(timestamp) == valor else valor)
+
+
+def _digitos_cpf(cpf: str) -> str:
+    """Dígitos de um CPF, com caminho rápido para o formato XXX.XXX.XXX-XX"""
+    digitos = cpf.replace(".", "").replace("-", "")
+    if digitos.isdecimal() or not digitos:
+        return digitos
+    return re.sub(r'\D', '', digitos)
 
 
 class Paciente:
@@ -32,7 +135,31 @@ class Paciente:
         self.idade = idade
         self.telefone = telefone
         self.cpf = cpf
-        self.data_cadastro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Data de cadastro guardada como epoch (segundos, horário local)
+        self.timestamp_cadastro = int(time.time())
+        # Texto original da data quando ele não pode ser reproduzido a partir
+        # do timestamp (ver o setter de data_cadastro)
+        self._data_cadastro_texto: Optional[str] = None
+
+    @property
+    def data_cadastro(self) -> str:
+        """Data de cadastro no formato YYYY-MM-DD HH:MM:SS"""
+        if self._data_cadastro_texto is not None:
+            return self._data_cadastro_texto
+        return _formatar_data(self.timestamp_cadastro)
+
+    @data_cadastro.setter
+    def data_cadastro(self, valor: str):
+        """
+        Define a data de cadastro a partir de um texto
+
+        Textos que a formatação não reproduz exatamente (outros formatos,
+        horários que não existem por causa do horário de verão ou datas que
+        não podem ser interpretadas) são mantidos como vieram, para que
+        carregar e salvar não alterem o arquivo. Datas que não podem ser
+        interpretadas ficam com timestamp_cadastro 0.
+        """
+        self.timestamp_cadastro, self._data_cadastro_texto = _ler_data_cadastro(valor)
 
     def to_dict(self) -> Dict:
         """Converte o objeto paciente para dicionário"""
@@ -53,48 +180,412 @@ class Paciente:
             telefone=data["telefone"],
             cpf=data.get("cpf", "")
         )
-        paciente.data_cadastro = data.get("data_cadastro", paciente.data_cadastro)
+        if "data_cadastro" in data:
+            paciente.data_cadastro = data["data_cadastro"]
         return paciente
 
 
+def particao_do_cpf(cpf: str, num_particoes: int) -> int:
+    """
+    Retorna a partição de um paciente pelo hash do CPF
+
+    Usa CRC32 dos dígitos do CPF, estável entre execuções (ao contrário de hash()).
+
+    Args:
+        cpf: CPF com ou sem formatação
+        num_particoes: Quantidade de partições
+
+    Returns:
+        int: Índice da partição entre 0 e num_particoes - 1
+    """
+    return zlib.crc32(_digitos_cpf(cpf).encode()) % num_particoes
+
+
+@contextmanager
+def _sem_coleta_de_lixo():
+    """
+    Suspende o coletor de lixo cíclico durante a criação de muitos objetos
+
+    Cada milhar de objetos novos dispara uma coleta que percorre os objetos
+    já existentes; ao carregar centenas de milhares de pacientes isso chega
+    a dobrar o tempo, e nenhum desses objetos forma ciclos.
+    """
+    ativo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if ativo:
+            gc.enable()
+
+
+def _numero_particao(caminho: str) -> Optional[int]:
+    """Número da partição pelo nome do arquivo (pacientes_NNN.json)"""
+    numero = os.path.basename(caminho)[len("pacientes_"):-len(".json")]
+    return int(numero) if numero.isdecimal() else None
+
+
+def _carregar_particao(caminho: str) -> Tuple[List[Tuple], List[str], Tuple[Counter, Counter], int]:
+    """
+    Carrega e prepara um arquivo de partição (executado nos processos do pool)
+
+    Além de interpretar o JSON, adianta em paralelo a parte dos índices que
+    não depende dos outros arquivos: datas convertidas, dígitos dos CPFs,
+    contagens de cadastros por dia e por hora e ordenação por data.
+    Devolve tuplas em vez de objetos Paciente porque tuplas de str/int são
+    muito mais baratas de serializar entre processos.
+
+    Args:
+        caminho: Caminho do arquivo JSON da partição
+
+    Returns:
+        Tupla com as linhas (timestamp, texto da data ou None, nome, idade,
+        telefone, cpf) ordenadas por data de cadastro, os dígitos dos CPFs na
+        mesma ordem, as contagens por dia e por hora e a quantidade de CPFs
+        inválidos
+    """
+    with _sem_coleta_de_lixo():
+        with open(caminho, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+
+        agora = int(time.time())
+        linhas = []
+        for d in dados:
+            timestamp, texto = (_ler_data_cadastro(d["data_cadastro"]) if "data_cadastro" in d
+                                else (agora, None))
+            linhas.append((timestamp, texto, d["nome"], d["idade"], d["telefone"], d.get("cpf", "")))
+    linhas.sort(key=itemgetter(0))
+
+    digitos = [_digitos_cpf(linha[5]) for linha in linhas]
+    invalidos = sum(1 for linha in linhas if linha[5] and not SistemaClinica.validar_cpf(linha[5]))
+    contagens = contar_por_dia_e_hora(map(itemgetter(0), linhas))
+    return linhas, digitos, contagens, invalidos
+
+
 class SistemaClinica:
     """Classe principal do sistema de gestão da clínica"""
 
-    def __init__(self):
-        self.pacientes: List[Paciente] = []
-        self.arquivo_dados = os.path.join("clinica-vida-plus", "data", "pacientes.json")
-        self.dir_backup = os.path.join("clinica-vida-plus", "backups")
+    def __init__(self, arquivo_dados: Optional[str] = None, dir_backup: Optional[str] = None,
+                 carregamento_assincrono: bool = False, num_particoes: int = 0):
+        """
+        Args:
+            arquivo_dados: Caminho do arquivo JSON de pacientes
+            dir_backup: Diretório dos backups
+            carregamento_assincrono: Se True, o construtor retorna imediatamente
+                e os dados são carregados em uma thread em segundo plano
+            num_particoes: Se maior que zero, os pacientes são divididos pelo
+                hash do CPF em arquivos data/particoes/pacientes_NNN.json,
+                carregados em paralelo; cada salvamento regrava apenas as
+                partições alteradas. Zero usa o arquivo único.
+        """
+        self.arquivo_dados = arquivo_dados or os.path.join("clinica-vida-plus", "data", "pacientes.json")
+        self.dir_backup = dir_backup or os.path.join("clinica-vida-plus", "backups")
+        self.num_particoes = num_particoes
+        self.dir_particoes = os.path.join(os.path.dirname(self.arquivo_dados), "particoes")
+        self._particoes: List[List[Paciente]] = [[] for _ in range(num_particoes)]
+        self._particoes_alteradas = set()
+        # Verdadeiro quando o arquivo único foi carregado e redistribuído nas
+        # partições nesta execução; só então ele pode ser aposentado
+        self._migrar_arquivo_unico = False
+        self._pacientes: List[Paciente] = []
+        self.indice_idade = IndiceIdade()
+        self.indice_cadastro = IndiceCadastro()
+        # CPF (apenas dígitos) -> paciente
+        self.indice_cpf: Dict[str, Paciente] = {}
+        # Construído na primeira busca aproximada para não atrasar o carregamento
+        self._indice_nomes: Optional[IndiceNomes] = None
+        self._lock = threading.Lock()
+        self._pronto = threading.Event()
         self._garantir_diretorios()
-        self.carregar_dados()
+
+        if carregamento_assincrono:
+            threading.Thread(target=self._carregamento_inicial, name="carregamento-pacientes",
+                             daemon=True).start()
+        else:
+            self._carregamento_inicial()
 
     def _garantir_diretorios(self):
         """Garante que os diretórios necessários existam"""
         os.makedirs(os.path.dirname(self.arquivo_dados), exist_ok=True)
         os.makedirs(self.dir_backup, exist_ok=True)
-
+        if self.num_particoes:
+            os.makedirs(self.dir_particoes, exist_ok=True)
+
+    @property
+    def pacientes(self) -> List[Paciente]:
+        """Pacientes cadastrados; para incluir um paciente use adicionar_paciente"""
+        return self._pacientes
+
+    @pacientes.setter
+    def pacientes(self, pacientes: List[Paciente]):
+        """Substitui todos os pacientes e reconstrói os índices"""
+        # Os índices são montados antes da troca: se algum falhar, o cadastro
+        # e os índices atuais continuam consistentes
+        indice_idade = IndiceIdade(pacientes)
+        indice_cadastro = IndiceCadastro(pacientes)
+        indice_cpf = {_digitos_cpf(p.cpf): p for p in pacientes}
+        particoes = [[] for _ in range(self.num_particoes)]
+        if self.num_particoes:
+            for paciente in pacientes:
+                particoes[particao_do_cpf(paciente.cpf, self.num_particoes)].append(paciente)
+
+        self._pacientes = pacientes
+        self.indice_idade = indice_idade
+        self.indice_cadastro = indice_cadastro
+        self.indice_cpf = indice_cpf
+        self._indice_nomes = None
+        if self.num_particoes:
+            self._particoes = particoes
+            self._particoes_alteradas = set(range(self.num_particoes))
+
+    def adicionar_paciente(self, paciente: Paciente):
+        """
+        Adiciona um paciente ao cadastro mantendo os índices atualizados
+
+        Args:
+            paciente: Paciente a adicionar
+        """
+        with self._lock:
+            self._pacientes.append(paciente)
+            self._indexar(paciente)
+
+    def _indexar(self, paciente: Paciente):
+        """Inclui um paciente já presente na lista nos índices e na sua partição"""
+        self.indice_idade.adicionar(paciente)
+        self.indice_cadastro.adicionar(paciente)
+        self.indice_cpf[_digitos_cpf(paciente.cpf)] = paciente
+        if self._indice_nomes is not None:
+            self._indice_nomes.adicionar(paciente)
+        if self.num_particoes:
+            particao = particao_do_cpf(paciente.cpf, self.num_particoes)
+            self._particoes[particao].append(paciente)
+            self._particoes_alteradas.add(particao)
+
+    def _carregamento_inicial(self):
+        """Carrega os dados e sinaliza que o sistema está pronto"""
+        try:
+            self.carregar_dados()
+        finally:
+            self._pronto.set()
+
+    @property
+    def pronto(self) -> bool:
+        """Indica se o carregamento inicial terminou"""
+        return self._pronto.is_set()
+
+    def aguardar_carregamento(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o fim do carregamento inicial
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+
+        Returns:
+            bool: True se os dados estão carregados
+        """
+        return self._pronto.wait(timeout)
+
+    def _aguardar_dados(self):
+        """Aguarda o carregamento inicial avisando o usuário se for preciso esperar"""
+        if not self.pronto:
+            print(f"{Fore.YELLOW}Aguardando carregamento dos dados...")
+            self.aguardar_carregamento()
+
+    def _arquivo_particao(self, particao: int) -> str:
+        """Caminho do arquivo de uma partição"""
+        return os.path.join(self.dir_particoes, f"pacientes_{particao:03d}.json")
+
+    def _arquivos_particoes_existentes(self) -> List[str]:
+        """Arquivos de partição presentes no disco"""
+        if not os.path.isdir(self.dir_particoes):
+            return []
+        return sorted(os.path.join(self.dir_particoes, nome) for nome in os.listdir(self.dir_particoes)
+                      if nome.startswith("pacientes_") and nome.endswith(".json"))
+
+    @instrumentar("carregar_dados")
     def carregar_dados(self):
         """Carrega os dados dos pacientes do arquivo JSON"""
+        if self.num_particoes and self._arquivos_particoes_existentes():
+            if os.path.exists(self.arquivo_dados):
+                print(f"{Fore.YELLOW}Atenção: {self.arquivo_dados} não é lido porque já existem "
+                      f"dados particionados em {self.dir_particoes}")
+            self._carregar_particoes()
+            return
+        if not self.num_particoes and self._arquivos_particoes_existentes():
+            print(f"{Fore.YELLOW}Atenção: existem dados particionados em {self.dir_particoes}, "
+                  f"que não são lidos com num_particoes=0")
         if os.path.exists(self.arquivo_dados):
             try:
-                with open(self.arquivo_dados, 'r', encoding='utf-8') as f:
-                    dados = json.load(f)
-                    self.pacientes = [Paciente.from_dict(p) for p in dados]
+                with _sem_coleta_de_lixo():
+                    with open(self.arquivo_dados, 'r', encoding='utf-8') as f:
+                        dados = json.load(f)
+                    carregados = [Paciente.from_dict(p) for p in dados]
+                with self._lock:
+                    if self.pronto:
+                        self.pacientes = carregados
+                    else:
+                        # Mantém os cadastros feitos durante o carregamento inicial
+                        self.pacientes = carregados + self._pacientes
+                    self._migrar_arquivo_unico = bool(self.num_particoes)
                 print(f"{Fore.GREEN}Dados carregados: {len(self.pacientes)} pacientes")
+                self._avisar_datas_invalidas(carregados)
             except Exception as e:
                 print(f"{Fore.RED}Erro ao carregar dados: {e}")
 
+    @staticmethod
+    def _avisar_datas_invalidas(pacientes: List[Paciente]):
+        """Avisa sobre pacientes cuja data de cadastro não pôde ser interpretada"""
+        invalidas = sum(1 for p in pacientes if p.timestamp_cadastro == SEM_DATA)
+        if invalidas:
+            print(f"{Fore.YELLOW}Atenção: {invalidas} paciente(s) com data de cadastro inválida "
+                  f"(mantida como está no arquivo)")
+
+    def _carregar_particoes(self):
+        """Carrega as partições em paralelo, uma por processo"""
+        arquivos = self._arquivos_particoes_existentes()
+        try:
+            processos = min(len(arquivos), os.cpu_count() or 1)
+            if processos > 1:
+                with ProcessPoolExecutor(max_workers=processos) as pool:
+                    resultados = list(pool.map(_carregar_particao, arquivos))
+            else:
+                resultados = [_carregar_particao(arquivo) for arquivo in arquivos]
+
+            # Cada paciente é criado uma única vez, já na lista da sua partição
+            particoes: List[List[Paciente]] = []
+            indice_cpf: Dict[str, Paciente] = {}
+            por_dia: Counter = Counter()
+            por_hora: Counter = Counter()
+            invalidos = 0
+            with _sem_coleta_de_lixo():
+                for linhas, digitos, (dias, horas), invalidos_particao in resultados:
+                    pacientes_particao = []
+                    for timestamp, texto, nome, idade, telefone, cpf in linhas:
+                        paciente = Paciente(nome, idade, telefone, cpf)
+                        paciente.timestamp_cadastro = timestamp
+                        paciente._data_cadastro_texto = texto
+                        pacientes_particao.append(paciente)
+                    particoes.append(pacientes_particao)
+                    indice_cpf.update(zip(digitos, pacientes_particao))
+                    por_dia.update(dias)
+                    por_hora.update(horas)
+                    invalidos += invalidos_particao
+
+            # As partições já vêm ordenadas por data, então esta ordenação só
+            # intercala as sequências (Timsort) e é a única feita aqui
+            carregados = [p for pacientes_particao in particoes for p in pacientes_particao]
+            carregados.sort(key=attrgetter("timestamp_cadastro"))
+
+            numeros = [_numero_particao(arquivo) for arquivo in arquivos]
+            with self._lock:
+                novos = [] if self.pronto else self._pacientes
+                if numeros == list(range(self.num_particoes)):
+                    indice_idade = IndiceIdade(carregados)
+                    indice_cadastro = IndiceCadastro(carregados, contagens=(por_dia, por_hora),
+                                                     ordenados=True)
+                    self._pacientes = carregados
+                    self._particoes = particoes
+                    self._particoes_alteradas = set()
+                    self.indice_idade = indice_idade
+                    self.indice_cadastro = indice_cadastro
+                    self.indice_cpf = indice_cpf
+                    self._indice_nomes = None
+                    for paciente in novos:
+                        self._pacientes.append(paciente)
+                        self._indexar(paciente)
+                else:
+                    # Com outro número de partições, tudo é redistribuído e
+                    # regravado no próximo salvamento
+                    self.pacientes = carregados + novos
+
+            print(f"{Fore.GREEN}Dados carregados: {len(self.pacientes)} pacientes "
+                  f"({len(arquivos)} partições)")
+            if invalidos:
+                print(f"{Fore.YELLOW}Atenção: {invalidos} paciente(s) com CPF inválido")
+            self._avisar_datas_invalidas(carregados)
+        except Exception as e:
+            print(f"{Fore.RED}Erro ao carregar dados: {e}")
+
+    @staticmethod
+    def _gravar_json(caminho: str, dados: List[Dict]):
+        """Grava um arquivo JSON por meio de um temporário, sem deixar arquivos pela metade"""
+        temporario = f"{caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, caminho)
+
+    def _salvar_particoes(self):
+        """Regrava apenas as partições alteradas e remove partições obsoletas"""
+        with self._lock:
+            alteradas = sorted(self._particoes_alteradas)
+            conteudos = [(i, [p.to_dict() for p in self._particoes[i]]) for i in alteradas]
+            self._particoes_alteradas = set()
+
+        # Partições que falharem voltam a ser marcadas para o próximo salvamento;
+        # cadastros feitos durante a gravação marcam as suas por conta própria
+        falhas = []
+        for i, dados in conteudos:
+            try:
+                self._gravar_json(self._arquivo_particao(i), dados)
+            except Exception as e:
+                falhas.append((i, e))
+        if falhas:
+            with self._lock:
+                self._particoes_alteradas.update(i for i, _ in falhas)
+            raise OSError(f"{len(falhas)} partição(ões) não gravada(s): {falhas[0][1]}")
+
+        validos = {self._arquivo_particao(i) for i in range(self.num_particoes)}
+        for arquivo in self._arquivos_particoes_existentes():
+            if arquivo not in validos:
+                os.remove(arquivo)
+
+        # Depois da migração o arquivo único fica desatualizado; é renomeado
+        # para não ser carregado por engano com num_particoes=0. Um arquivo
+        # único que não foi lido nesta execução tem dados que as partições não
+        # têm, então é mantido
+        if not os.path.exists(self.arquivo_dados):
+            return
+        if not self._migrar_arquivo_unico:
+            print(f"{Fore.YELLOW}Atenção: {self.arquivo_dados} não foi migrado porque não foi "
+                  f"carregado nesta execução; verifique-o manualmente")
+            return
+        migrado = f"{self.arquivo_dados}.migrado"
+        if os.path.exists(migrado):
+            migrado = f"{migrado}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        os.rename(self.arquivo_dados, migrado)
+        self._migrar_arquivo_unico = False
+        print(f"{Fore.YELLOW}Dados migrados para {self.dir_particoes}; "
+              f"arquivo único antigo renomeado para {migrado}")
+
+    @instrumentar("salvar_dados")
     def salvar_dados(self):
         """Salva os dados dos pacientes no arquivo JSON"""
+        # Salvar antes do fim do carregamento sobrescreveria o arquivo com dados parciais
+        self.aguardar_carregamento()
         try:
-            dados = [p.to_dict() for p in self.pacientes]
-            with open(self.arquivo_dados, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, ensure_ascii=False, indent=2)
+            if self.num_particoes:
+                self._salvar_particoes()
+            else:
+                dados = [p.to_dict() for p in self.pacientes]
+                with open(self.arquivo_dados, 'w', encoding='utf-8') as f:
+                    json.dump(dados, f, ensure_ascii=False, indent=2)
             print(f"{Fore.GREEN}Dados salvos com sucesso!")
         except Exception as e:
             print(f"{Fore.RED}Erro ao salvar dados: {e}")
 
+    @instrumentar("fazer_backup")
     def fazer_backup(self):
         """Cria um backup dos dados com timestamp"""
+        if self.num_particoes and self._arquivos_particoes_existentes():
+            try:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                dir_destino = os.path.join(self.dir_backup, f"pacientes_backup_{timestamp}")
+                shutil.copytree(self.dir_particoes, dir_destino)
+                print(f"{Fore.GREEN}Backup criado: {dir_destino}")
+            except Exception as e:
+                print(f"{Fore.RED}Erro ao criar backup: {e}")
+            return
+
         if not os.path.exists(self.arquivo_dados):
             print(f"{Fore.YELLOW}Nenhum dado para fazer backup")
             return
@@ -121,23 +612,24 @@ class SistemaClinica:
     def validar_cpf(cpf: str) -> bool:
         """Valida formato e dígitos verificadores do CPF"""
         # Remove caracteres não numéricos
-        cpf = re.sub(r'\D', '', cpf)
+        cpf = _digitos_cpf(cpf)
 
         if len(cpf) != 11 or cpf == cpf[0] * 11:
             return False
+        digitos = list(map(int, cpf))
 
         # Valida primeiro dígito verificador
-        soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
+        soma = sum(map(mul, digitos[:9], range(10, 1, -1)))
         digito1 = (soma * 10 % 11) % 10
 
-        if digito1 != int(cpf[9]):
+        if digito1 != digitos[9]:
             return False
 
         # Valida segundo dígito verificador
-        soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
+        soma = sum(map(mul, digitos[:10], range(11, 1, -1)))
         digito2 = (soma * 10 % 11) % 10
 
-        return digito2 == int(cpf[10])
+        return digito2 == digitos[10]
 
     def cadastrar_paciente(self):
         """Cadastra um novo paciente no sistema"""
@@ -179,7 +671,8 @@ class SistemaClinica:
 
             # Cria e adiciona o paciente
             paciente = Paciente(nome=nome, idade=idade, telefone=telefone, cpf=cpf)
-            self.pacientes.append(paciente)
+            self.adicionar_paciente(paciente)
+            self._aguardar_dados()
             self.salvar_dados()
 
             print(f"\n{Fore.GREEN}{Style.BRIGHT}✓ Paciente cadastrado com sucesso!")
@@ -190,47 +683,152 @@ class SistemaClinica:
         except Exception as e:
             print(f"{Fore.RED}Erro ao cadastrar: {e}")
 
+    @instrumentar("ver_estatisticas")
     def ver_estatisticas(self):
         """Exibe estatísticas dos pacientes cadastrados"""
         print(f"\n{Fore.CYAN}{Style.BRIGHT}=== ESTATÍSTICAS ===")
+        self._aguardar_dados()
 
         if not self.pacientes:
             print(f"{Fore.YELLOW}Nenhum paciente cadastrado")
             return
 
-        total = len(self.pacientes)
-        idades = [p.idade for p in self.pacientes]
-        idade_media = sum(idades) / total
-        paciente_mais_novo = min(self.pacientes, key=lambda p: p.idade)
-        paciente_mais_velho = max(self.pacientes, key=lambda p: p.idade)
+        indice = self.indice_idade
+        total = indice.total
+        idade_media = indice.media()
+        paciente_mais_novo = indice.mais_novo()
+        paciente_mais_velho = indice.mais_velho()
 
         print(f"{Fore.WHITE}Total de pacientes: {Fore.GREEN}{total}")
         print(f"{Fore.WHITE}Idade média: {Fore.GREEN}{idade_media:.1f} anos")
         print(f"{Fore.WHITE}Paciente mais novo: {Fore.GREEN}{paciente_mais_novo.nome} ({paciente_mais_novo.idade} anos)")
         print(f"{Fore.WHITE}Paciente mais velho: {Fore.GREEN}{paciente_mais_velho.nome} ({paciente_mais_velho.idade} anos)")
+        print(f"{Fore.WHITE}Idade mediana: {Fore.GREEN}{indice.percentil(50)} anos")
+        print(f"{Fore.WHITE}Pacientes com 60 anos ou mais: {Fore.GREEN}{indice.contar_intervalo(60)}")
+
+        print(f"\n{Fore.WHITE}Pacientes por faixa etária:")
+        for faixa, quantidade in indice.histograma(FAIXAS_ETARIAS).items():
+            print(f"{Fore.WHITE}  {faixa:>6}: {Fore.GREEN}{quantidade}")
+
+    @instrumentar("relatorio_cadastros")
+    def relatorio_cadastros(self, dias: int = 7):
+        """
+        Exibe as tendências de cadastro dos últimos dias
+
+        Args:
+            dias: Quantidade de dias (incluindo hoje) exibidos no relatório
+        """
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}=== TENDÊNCIAS DE CADASTRO ===")
+        self._aguardar_dados()
+
+        if not self.pacientes:
+            print(f"{Fore.YELLOW}Nenhum paciente cadastrado")
+            return
+
+        indice = self.indice_cadastro
+        hoje = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        inicio_semana = hoje - timedelta(days=hoje.weekday())
+        amanha = hoje + timedelta(days=1)
+
+        print(f"{Fore.WHITE}Cadastros hoje: {Fore.GREEN}{indice.contar_periodo(hoje, amanha)}")
+        print(f"{Fore.WHITE}Cadastros nesta semana: {Fore.GREEN}{indice.contar_periodo(inicio_semana, amanha)}")
+
+        print(f"\n{Fore.WHITE}Cadastros por dia (últimos {dias} dias):")
+        primeiro_dia = (hoje - timedelta(days=dias - 1)).date()
+        por_dia = indice.contagem_por_dia(primeiro_dia, hoje.date())
+        for i in range(dias):
+            dia = primeiro_dia + timedelta(days=i)
+            quantidade = por_dia.get(dia, 0)
+            print(f"{Fore.WHITE}  {dia.strftime('%d/%m/%Y')}: {Fore.GREEN}{quantidade:>5} {'█' * min(quantidade, 40)}")
+
+        por_hora = indice.contagem_por_hora_do_dia()
+        hora_pico = max(por_hora, key=por_hora.get)
+        if por_hora[hora_pico]:
+            print(f"\n{Fore.WHITE}Horário com mais cadastros: {Fore.GREEN}{hora_pico:02d}h "
+                  f"({por_hora[hora_pico]} cadastros)")
+        if indice.sem_data:
+            print(f"{Fore.YELLOW}Cadastros sem data válida (fora do relatório): {len(indice.sem_data)}")
+
+    @instrumentar("buscar_por_nome")
+    def buscar_por_nome(self, busca: str) -> List[Paciente]:
+        """
+        Retorna os pacientes cujo nome contém o texto buscado
+
+        Args:
+            busca: Trecho do nome (sem diferenciar maiúsculas/minúsculas)
+
+        Returns:
+            Lista de pacientes encontrados
+        """
+        self.aguardar_carregamento()
+        busca = busca.lower()
+        return [p for p in self.pacientes if busca in p.nome.lower()]
+
+    def buscar_por_cpf(self, cpf: str) -> Optional[Paciente]:
+        """
+        Retorna o paciente com o CPF informado
+
+        Args:
+            cpf: CPF com ou sem formatação
+
+        Returns:
+            Paciente encontrado ou None
+        """
+        return self.indice_cpf.get(re.sub(r'\D', '', cpf))
+
+    @instrumentar("buscar_aproximado")
+    def buscar_aproximado(self, busca: str, limite: int = 10) -> List[Tuple[Paciente, float]]:
+        """
+        Busca tolerante a acentos e erros de digitação ("Joao Slva" encontra "João Silva")
+
+        Args:
+            busca: Palavras do nome buscado
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Lista de (paciente, similaridade entre 0 e 1), mais similares primeiro
+        """
+        self.aguardar_carregamento()
+        with self._lock:
+            if self._indice_nomes is None:
+                self._indice_nomes = IndiceNomes(self._pacientes)
+            indice = self._indice_nomes
+        return indice.buscar(busca, limite)
 
     def buscar_paciente(self):
         """Busca um paciente por nome"""
         print(f"\n{Fore.CYAN}{Style.BRIGHT}=== BUSCAR PACIENTE ===")
+        self._aguardar_dados()
 
         if not self.pacientes:
             print(f"{Fore.YELLOW}Nenhum paciente cadastrado")
             return
 
-        busca = input(f"{Fore.WHITE}Digite o nome para buscar: ").strip().lower()
+        busca = input(f"{Fore.WHITE}Digite o nome para buscar: ").strip()
 
-        encontrados = [p for p in self.pacientes if busca in p.nome.lower()]
+        encontrados = self.buscar_por_nome(busca)
 
         if encontrados:
             print(f"\n{Fore.GREEN}Encontrados {len(encontrados)} paciente(s):\n")
             for p in encontrados:
                 self._exibir_paciente(p)
+            return
+
+        # Sem resultado exato: tenta ignorando acentos e pequenos erros de digitação
+        aproximados = self.buscar_aproximado(busca)
+        if aproximados:
+            print(f"\n{Fore.YELLOW}Nenhum resultado exato. Nomes parecidos:\n")
+            for p, similaridade in aproximados:
+                print(f"{Fore.MAGENTA}[{similaridade:.0%} similar]")
+                self._exibir_paciente(p)
         else:
             print(f"{Fore.YELLOW}Nenhum paciente encontrado com esse nome")
 
+    @instrumentar("listar_pacientes")
     def listar_pacientes(self):
         """Lista todos os pacientes cadastrados"""
         print(f"\n{Fore.CYAN}{Style.BRIGHT}=== LISTA DE PACIENTES ===")
+        self._aguardar_dados()
 
         if not self.pacientes:
             print(f"{Fore.YELLOW}Nenhum paciente cadastrado")
@@ -263,7 +861,8 @@ class SistemaClinica:
             print(f"{Fore.WHITE}3. {Fore.CYAN}Buscar paciente")
             print(f"{Fore.WHITE}4. {Fore.CYAN}Listar todos os pacientes")
             print(f"{Fore.WHITE}5. {Fore.CYAN}Fazer backup dos dados")
-            print(f"{Fore.WHITE}6. {Fore.RED}Sair")
+            print(f"{Fore.WHITE}6. {Fore.CYAN}Ver tendências de cadastro")
+            print(f"{Fore.WHITE}7. {Fore.RED}Sair")
             print(f"{Fore.BLUE}{Style.BRIGHT}{'='*40}")
 
             try:
@@ -280,10 +879,12 @@ class SistemaClinica:
                 elif opcao == "5":
                     self.fazer_backup()
                 elif opcao == "6":
+                    self.relatorio_cadastros()
+                elif opcao == "7":
                     print(f"\n{Fore.GREEN}Obrigado por usar o Sistema Clínica Vida+!")
                     break
                 else:
-                    print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 6")
+                    print(f"{Fore.RED}Opção inválida! Escolha entre 1 e 7")
 
             except KeyboardInterrupt:
                 print(f"\n\n{Fore.YELLOW}Programa interrompido pelo usuário")
@@ -298,7 +899,8 @@ def main():
         print("Aviso: colorama não instalado. Execute: pip install colorama")
         print("O sistema funcionará sem cores.\n")
 
-    sistema = SistemaClinica()
+    # O menu aparece imediatamente; os dados terminam de carregar em segundo plano
+    sistema = SistemaClinica(carregamento_assincrono=True)
     sistema.menu_principal()
 
 
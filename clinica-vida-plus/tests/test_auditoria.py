@@ -0,0 +1,69 @@
+"""
+Testes da auditoria de acesso
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.auditoria import AuditoriaAcesso
+
+RESULTADO = {"tipo": "emergencia", "regra": "C ∧ (B ∨ D)",
+             "valores": {"C - Médico disponível": True}, "permitido": True}
+
+
+def test_descarregar_concorrente_com_thread_de_escrita(tmp_path):
+    auditoria = AuditoriaAcesso(str(tmp_path), intervalo=0.001, tamanho_lote=10)
+    auditoria.iniciar()
+
+    def registrar():
+        for i in range(2000):
+            auditoria.registrar(RESULTADO)
+            if i % 50 == 0:
+                auditoria.descarregar()
+
+    threads = [threading.Thread(target=registrar) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    auditoria.fechar()
+
+    agora = datetime.now()
+    registros = list(auditoria.consultar(agora - timedelta(days=1), agora + timedelta(days=1)))
+    assert len(registros) == 8000
+    assert auditoria.descartados == 0
+
+
+def test_lote_com_falha_na_gravacao_volta_ao_buffer(tmp_path, monkeypatch):
+    import src.auditoria as modulo
+
+    auditoria = AuditoriaAcesso(str(tmp_path), capacidade=15)
+    for _ in range(10):
+        auditoria.registrar(RESULTADO)
+
+    abrir = modulo.gzip.open
+
+    def abrir_com_falha(caminho, modo):
+        arquivo = abrir(caminho, modo)
+        arquivo.write(b"registro pela metade")
+        arquivo.close()
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(modulo.gzip, "open", abrir_com_falha)
+    with pytest.raises(OSError):
+        auditoria.descarregar()
+    assert len(auditoria._buffer) == 10
+
+    # Registros novos entram depois dos devolvidos; o excesso descarta os mais antigos
+    for _ in range(10):
+        auditoria.registrar(RESULTADO)
+    assert len(auditoria._buffer) == 15
+    assert auditoria.descartados == 5
+
+    monkeypatch.setattr(modulo.gzip, "open", abrir)
+    auditoria.descarregar()
+    agora = datetime.now()
+    registros = list(auditoria.consultar(agora - timedelta(days=1), agora + timedelta(days=1)))
+    assert len(registros) == 15
@@ -0,0 +1,49 @@
+"""
+Testes do check-in em lote
+"""
+
+import json
+import os
+
+from benchmarks.dados_sinteticos import gerar_pacientes
+from src.checkin import CheckIn
+from src.fila_atendimento import FilaAtendimento
+from src.main import SistemaClinica
+
+LIBERADO = {"A": True, "B": True, "C": True, "D": True}
+
+
+def criar_sistema(diretorio, quantidade, **kwargs):
+    arquivo = os.path.join(diretorio, "data", "pacientes.json")
+    os.makedirs(os.path.dirname(arquivo))
+    dados = list(gerar_pacientes(quantidade, semente=7))
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f)
+    sistema = SistemaClinica(arquivo, os.path.join(diretorio, "backups"), **kwargs)
+    return sistema, dados
+
+
+def test_lote_com_motivos_de_recusa(tmp_path):
+    sistema, dados = criar_sistema(str(tmp_path), 50)
+    fila = FilaAtendimento()
+    resultados = CheckIn(fila, sistema).processar_lote([
+        dict(LIBERADO, cpf=dados[0]["cpf"].replace(".", "").replace("-", "")),
+        dict(LIBERADO, cpf="123.456.789-00"),
+        dict(LIBERADO, cpf="529.982.247-25"),
+        {"cpf": dados[1]["cpf"], "prioridade": "normal"},
+    ])
+
+    assert [r["admitido"] for r in resultados] == [True, False, False, False]
+    assert [r["motivo"] for r in resultados] == ["", "cpf_invalido", "nao_cadastrado", "acesso_negado"]
+    assert resultados[0]["nome"] == dados[0]["nome"]
+    assert resultados[0]["cpf"] == dados[0]["cpf"]
+    assert fila.tamanho_total() == 1
+
+
+def test_lote_aguarda_carregamento_assincrono(tmp_path):
+    sistema, dados = criar_sistema(str(tmp_path), 20000, carregamento_assincrono=True)
+    chegadas = [dict(LIBERADO, cpf=d["cpf"]) for d in dados[-5:]]
+
+    resultados = CheckIn(FilaAtendimento(), sistema).processar_lote(chegadas)
+
+    assert all(r["admitido"] for r in resultados)
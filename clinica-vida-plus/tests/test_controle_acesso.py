@@ -0,0 +1,68 @@
+"""
+Testes do controle de acesso: regras em DNF e contagem de modelos
+"""
+
+import random
+from itertools import product
+
+import pytest
+
+from src.controle_acesso import (NUM_VARIAVEIS, REGRA_CONSULTA_NORMAL, REGRA_EMERGENCIA,
+                                  ControleAcesso)
+
+
+def contar_forca_bruta(regra, num_variaveis):
+    return sum(1 for valores in product((False, True), repeat=num_variaveis)
+               if any(all(valores[i] == v for i, v in clausula.items()) for clausula in regra))
+
+
+def regra_aleatoria(gerador, num_variaveis, num_clausulas):
+    regra = []
+    for _ in range(num_clausulas):
+        variaveis = gerador.sample(range(num_variaveis), gerador.randint(1, num_variaveis))
+        regra.append({i: gerador.random() < 0.5 for i in variaveis})
+    return regra
+
+
+def test_funcoes_seguem_as_regras_originais():
+    for A, B, C, D in product((False, True), repeat=4):
+        assert ControleAcesso.consulta_normal(A, B, C, D) == bool((A and B and C) or (B and C and D))
+        assert ControleAcesso.emergencia(A, B, C, D) == bool(C and (B or D))
+        valores = (A, B, C, D)
+        assert bool(ControleAcesso.consulta_normal(*valores)) == \
+            ControleAcesso.avaliar_regra(REGRA_CONSULTA_NORMAL, valores)
+        assert bool(ControleAcesso.emergencia(*valores)) == \
+            ControleAcesso.avaliar_regra(REGRA_EMERGENCIA, valores)
+
+
+def test_tabelas_verdade_seguem_as_regras():
+    for regra, tabela in ((REGRA_CONSULTA_NORMAL, ControleAcesso.gerar_tabela_verdade_consulta_normal()),
+                          (REGRA_EMERGENCIA, ControleAcesso.gerar_tabela_verdade_emergencia())):
+        assert len(tabela) == 2 ** NUM_VARIAVEIS
+        for *valores, resultado in tabela:
+            assert resultado == ControleAcesso.avaliar_regra(regra, valores)
+
+
+def test_contagem_das_regras_da_clinica():
+    assert ControleAcesso.contar_situacoes_permitidas() == {
+        "consulta_normal": 3,
+        "emergencia": 6,
+        "total_combinacoes": 16,
+    }
+
+
+@pytest.mark.parametrize("num_variaveis,num_clausulas", [
+    (1, 1), (3, 2), (4, 4), (6, 3), (6, 9), (8, 8), (8, 12), (10, 30),
+])
+def test_contar_modelos_igual_forca_bruta(num_variaveis, num_clausulas):
+    gerador = random.Random(num_variaveis * 100 + num_clausulas)
+    for _ in range(20):
+        regra = regra_aleatoria(gerador, num_variaveis, num_clausulas)
+        assert ControleAcesso.contar_modelos(regra, num_variaveis) == \
+            contar_forca_bruta(regra, num_variaveis)
+
+
+def test_contar_modelos_casos_limite():
+    assert ControleAcesso.contar_modelos([], 4) == 0
+    assert ControleAcesso.contar_modelos([{}], 4) == 16
+    assert ControleAcesso.contar_modelos([{0: True}, {0: False}], 3) == 8
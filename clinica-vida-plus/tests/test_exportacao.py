@@ -0,0 +1,90 @@
+"""
+Testes da exportação do cadastro
+"""
+
+import csv
+import gzip
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from benchmarks.dados_sinteticos import gerar_pacientes
+from src import exportacao
+from src.exportacao import exportar_colunar, exportar_csv, exportar_ndjson, ler_colunar
+from src.main import Paciente, SistemaClinica
+
+
+@pytest.fixture
+def sistema(tmp_path):
+    sistema = SistemaClinica(os.path.join(str(tmp_path), "data", "pacientes.json"),
+                             os.path.join(str(tmp_path), "backups"))
+    sistema.pacientes = [Paciente.from_dict(d) for d in gerar_pacientes(100, semente=3)]
+    sistema.adicionar_paciente(Paciente("Sem Cpf", 40, "(11) 91234-5678"))
+    return sistema
+
+
+def ler_blocos(caminho):
+    colunas = {}
+    blocos = 0
+    for bloco in ler_colunar(caminho):
+        blocos += 1
+        for campo, valores in bloco.items():
+            colunas.setdefault(campo, []).extend(valores)
+    return colunas, blocos
+
+
+def test_colunar_ida_e_volta(sistema, tmp_path, monkeypatch):
+    monkeypatch.setattr(exportacao, "TAMANHO_BLOCO", 7)
+    caminho = str(tmp_path / "pacientes.col")
+
+    assert exportar_colunar(sistema, caminho) == 101
+    colunas, blocos = ler_blocos(caminho)
+
+    assert blocos == 15
+    assert colunas["idade"] == [p.idade for p in sistema.pacientes]
+    assert colunas["timestamp_cadastro"] == [p.timestamp_cadastro for p in sistema.pacientes]
+    assert colunas["cpf"] == [int(p.cpf.replace(".", "").replace("-", "")) if p.cpf else -1
+                              for p in sistema.pacientes]
+
+
+def test_colunar_com_campos_e_filtros(sistema, tmp_path):
+    caminho = str(tmp_path / "idosos.col")
+    esperadas = [p.idade for p in sistema.pacientes if p.idade >= 60]
+
+    assert exportar_colunar(sistema, caminho, campos=("idade",), idade_min=60) == len(esperadas)
+    colunas, _ = ler_blocos(caminho)
+    assert list(colunas) == ["idade"]
+    assert colunas["idade"] == esperadas
+
+
+def test_colunar_vazio_e_assinatura_invalida(sistema, tmp_path):
+    caminho = str(tmp_path / "vazio.col")
+    assert exportar_colunar(sistema, caminho, inicio=datetime(1900, 1, 1), fim=datetime(1900, 1, 2)) == 0
+    assert list(ler_colunar(caminho)) == []
+
+    invalido = tmp_path / "invalido.col"
+    invalido.write_bytes(b"outro formato")
+    with pytest.raises(ValueError):
+        list(ler_colunar(str(invalido)))
+
+    with pytest.raises(ValueError):
+        exportar_colunar(sistema, caminho, campos=("nome",))
+
+
+@pytest.mark.parametrize("compactar", [False, True])
+def test_csv_e_ndjson_ida_e_volta(sistema, tmp_path, compactar):
+    abrir = gzip.open if compactar else open
+    esperados = [p.to_dict() for p in sistema.pacientes]
+
+    caminho_csv = str(tmp_path / "pacientes.csv")
+    assert exportar_csv(sistema, caminho_csv, compactar=compactar) == len(esperados)
+    with abrir(caminho_csv, 'rt', encoding='utf-8', newline='') as f:
+        linhas = list(csv.DictReader(f))
+    assert [dict(l, idade=int(l["idade"])) for l in linhas] == esperados
+
+    caminho_ndjson = str(tmp_path / "pacientes.ndjson")
+    assert exportar_ndjson(sistema, caminho_ndjson, compactar=compactar) == len(esperados)
+    with abrir(caminho_ndjson, 'rt', encoding='utf-8') as f:
+        assert [json.loads(linha) for linha in f] == esperados
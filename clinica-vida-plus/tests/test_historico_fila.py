@@ -0,0 +1,127 @@
+"""
+Testes do histórico da fila de atendimento
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.fila_atendimento import FilaAtendimento, PacienteFila
+from src.historico_fila import ENTRADA, SAIDA, HistoricoFila
+
+DIA = datetime(2025, 10, 15)
+CPF_A = "529.982.247-25"
+CPF_B = "111.444.777-35"
+
+
+def momento(hora, minuto=0):
+    return DIA.replace(hour=hora, minute=minuto).timestamp()
+
+
+def test_espera_pareia_por_cpf_e_prioridade(tmp_path):
+    historico = HistoricoFila(str(tmp_path))
+    historico.registrar(ENTRADA, "normal", CPF_A, momento(8, 0))
+    historico.registrar(ENTRADA, "emergencia", CPF_B, momento(8, 5))
+    historico.registrar(ENTRADA, "normal", CPF_B, momento(8, 10))
+    historico.registrar(SAIDA, "emergencia", CPF_B, momento(8, 6))
+    historico.registrar(SAIDA, "normal", CPF_B, momento(8, 30))
+    historico.registrar(SAIDA, "normal", CPF_A, momento(8, 40))
+
+    espera = historico.espera_media_por_prioridade(DIA.date(), DIA.date())
+
+    assert espera["emergencia"] == 1
+    assert espera["normal"] == (40 + 20) / 2
+    assert espera["preferencial"] is None
+
+
+def test_sessao_zera_ocupacao_e_esperas_abertas(tmp_path):
+    historico = HistoricoFila(str(tmp_path))
+    historico.iniciar_sessao(momento(8))
+    historico.registrar(ENTRADA, "normal", CPF_A, momento(8, 1))
+    historico.registrar(ENTRADA, "normal", CPF_B, momento(8, 2))
+    # O programa foi reiniciado com os dois pacientes ainda na fila
+    historico.iniciar_sessao(momento(9))
+    historico.registrar(ENTRADA, "normal", CPF_A, momento(9, 1))
+    historico.registrar(SAIDA, "normal", CPF_A, momento(9, 11))
+
+    resumo = historico.resumo(DIA.date(), DIA.date())
+
+    assert resumo["pico"] == (datetime.fromtimestamp(momento(8, 2)), 2)
+    assert resumo["espera_media"]["normal"] == 10
+    assert resumo["pacientes_por_hora"][8] == 2
+    assert resumo["pacientes_por_hora"][9] == 1
+    assert sum(resumo["pacientes_por_hora"].values()) == 3
+
+
+def test_pico_nao_soma_filas_de_execucoes_diferentes(tmp_path):
+    for hora in (8, 9):
+        historico = HistoricoFila(str(tmp_path))
+        historico.iniciar_sessao(momento(hora))
+        historico.registrar(ENTRADA, "normal", CPF_A, momento(hora, 1))
+        historico.registrar(ENTRADA, "normal", CPF_B, momento(hora, 2))
+        historico.descarregar()
+
+    assert HistoricoFila(str(tmp_path)).pico(DIA.date(), DIA.date())[1] == 2
+
+
+def test_fila_marca_sessao_ao_ser_criada(tmp_path):
+    historico = HistoricoFila(str(tmp_path))
+    fila = FilaAtendimento(historico)
+    fila.adicionar(PacienteFila("Ana", CPF_A))
+    FilaAtendimento(historico).adicionar(PacienteFila("Bia", CPF_B))
+
+    hoje = datetime.now().date()
+    assert historico.pico(hoje, hoje)[1] == 1
+
+
+def test_thread_grava_eventos_periodicamente(tmp_path):
+    historico = HistoricoFila(str(tmp_path), intervalo=0.01)
+    historico.iniciar()
+    try:
+        historico.registrar(ENTRADA, "normal", CPF_A, momento(8))
+        limite = time.monotonic() + 2
+        while not (tmp_path / "20251015" / "timestamp.bin").exists() and time.monotonic() < limite:
+            time.sleep(0.01)
+        assert len(historico.ler_dia(DIA.date())["timestamp"]) == 1
+    finally:
+        historico.fechar()
+
+
+def test_colunas_desalinhadas_sao_cortadas_na_leitura(tmp_path):
+    historico = HistoricoFila(str(tmp_path))
+    historico.registrar(ENTRADA, "normal", CPF_A, momento(8))
+    historico.registrar(SAIDA, "normal", CPF_A, momento(8, 10))
+    historico.descarregar()
+    # Gravação interrompida: só o timestamp recebeu um terceiro evento, e pela metade
+    with open(tmp_path / "20251015" / "timestamp.bin", "ab") as f:
+        f.write(b"\x01" * 12)
+
+    colunas = historico.ler_dia(DIA.date())
+    assert {len(valores) for valores in colunas.values()} == {2}
+    assert historico.espera_media_por_prioridade(DIA.date(), DIA.date())["normal"] == 10
+
+
+def test_falha_na_gravacao_mantem_colunas_alinhadas(tmp_path, monkeypatch):
+    import src.historico_fila as modulo
+
+    historico = HistoricoFila(str(tmp_path))
+    historico.registrar(ENTRADA, "normal", CPF_A, momento(8))
+    historico.descarregar()
+    historico.registrar(SAIDA, "normal", CPF_A, momento(8, 10))
+
+    def abrir_com_falha(caminho, modo="r"):
+        if caminho.endswith("evento.bin"):
+            raise OSError("disco cheio")
+        return open(caminho, modo)
+
+    monkeypatch.setattr(modulo, "open", abrir_com_falha, raising=False)
+    with pytest.raises(OSError):
+        historico.descarregar()
+    tamanhos = {nome.name: nome.stat().st_size for nome in (tmp_path / "20251015").iterdir()}
+    assert tamanhos["timestamp.bin"] == 8 and tamanhos["evento.bin"] == 1
+
+    monkeypatch.delattr(modulo, "open")
+    historico.descarregar()
+    assert len(historico.ler_dia(DIA.date())["evento"]) == 2
+    assert historico.espera_media_por_prioridade(DIA.date(), DIA.date())["normal"] == 10
@@ -0,0 +1,126 @@
+"""
+Testes dos índices em memória
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.indices import (FAIXAS_ETARIAS, ArvoreBK, IndiceIdade, IndiceNomes, distancia_edicao,
+                         normalizar_texto)
+
+
+def pessoa(idade, nome=""):
+    return SimpleNamespace(idade=idade, nome=nome)
+
+
+def percentil_forca_bruta(idades, p):
+    ordenadas = sorted(idades)
+    posto = max(1, -(-len(ordenadas) * p // 100))
+    return ordenadas[int(posto) - 1]
+
+
+def test_percentil_sem_pacientes():
+    assert IndiceIdade().percentil(50) is None
+
+
+@pytest.mark.parametrize("p", [0, 100])
+def test_percentil_com_um_paciente(p):
+    assert IndiceIdade([pessoa(37)]).percentil(p) == 37
+
+
+def test_percentil_extremos():
+    indice = IndiceIdade([pessoa(i) for i in (50, 3, 90, 3, 149, 18)])
+    assert indice.percentil(0) == 3
+    assert indice.percentil(100) == 149
+    assert indice.percentil(50) == 18
+
+
+def test_percentil_igual_forca_bruta():
+    gerador = random.Random(5)
+    idades = [gerador.randint(0, 120) for _ in range(999)]
+    indice = IndiceIdade(pessoa(i) for i in idades)
+    for p in (0, 0.1, 1, 25, 33.3, 50, 75, 99, 99.9, 100):
+        assert indice.percentil(p) == percentil_forca_bruta(idades, p)
+
+
+def test_contagens_e_histograma():
+    idades = [0, 17, 18, 29, 30, 44, 45, 59, 60, 149, 200, -1]
+    indice = IndiceIdade()
+    for idade in idades:
+        indice.adicionar(pessoa(idade))
+
+    assert indice.contar_intervalo() == len(idades)
+    assert indice.contar_intervalo(18, 59) == 6
+    assert indice.histograma(FAIXAS_ETARIAS) == {"0-17": 3, "18-29": 2, "30-44": 2, "45-59": 2, "60+": 3}
+    assert [p.idade for p in indice.pacientes_intervalo(60)] == [60, 149, 200]
+    assert indice.mais_novo().idade == 0
+    assert indice.mais_velho().idade == 149
+
+
+def levenshtein(a, b):
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        atual = [i]
+        for j, cb in enumerate(b, 1):
+            atual.append(min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + (ca != cb)))
+        anterior = atual
+    return anterior[-1]
+
+
+def palavras_aleatorias(gerador, quantidade, alfabeto="abcde"):
+    return ["".join(gerador.choice(alfabeto) for _ in range(gerador.randint(0, 8)))
+            for _ in range(quantidade)]
+
+
+def test_distancia_edicao_igual_forca_bruta():
+    gerador = random.Random(8)
+    palavras = palavras_aleatorias(gerador, 60)
+    for a in palavras:
+        for b in palavras:
+            exata = levenshtein(a, b)
+            for limite in (0, 1, 2, 3, 10):
+                assert distancia_edicao(a, b, limite) == min(exata, limite + 1)
+
+
+@pytest.mark.parametrize("tolerancia", [0, 1, 2, 3])
+def test_arvore_bk_igual_forca_bruta(tolerancia):
+    gerador = random.Random(tolerancia)
+    vocabulario = set(palavras_aleatorias(gerador, 400))
+    arvore = ArvoreBK()
+    for palavra in vocabulario:
+        arvore.adicionar(palavra)
+    arvore.adicionar(next(iter(vocabulario)))
+
+    for busca in palavras_aleatorias(gerador, 40):
+        esperadas = {(p, levenshtein(busca, p)) for p in vocabulario if levenshtein(busca, p) <= tolerancia}
+        encontradas = arvore.buscar(busca, tolerancia)
+        assert len(encontradas) == len(set(encontradas))
+        assert set(encontradas) == esperadas
+
+
+def test_arvore_bk_vazia():
+    assert ArvoreBK().buscar("silva", 2) == []
+
+
+def test_normalizar_texto():
+    assert normalizar_texto("João CONCEIÇÃO Müller") == "joao conceicao muller"
+
+
+def test_busca_por_nome_tolerante():
+    pacientes = [pessoa(30, nome) for nome in
+                 ("João Silva", "Joana Silveira", "Maria Souza", "José da Silva", "Ana Sá")]
+    indice = IndiceNomes(pacientes[:3])
+    for paciente in pacientes[3:]:
+        indice.adicionar(paciente)
+
+    resultados = indice.buscar("Joao Slva")
+    assert resultados[0][0].nome == "João Silva"
+    assert resultados[0][1] == pytest.approx(1 - 1 / 8)
+    assert all(paciente.nome != "Maria Souza" for paciente, _ in resultados)
+
+    assert [p.nome for p, _ in indice.buscar("ana sa")] == ["Ana Sá"]
+    assert [p.nome for p, _ in indice.buscar("SILVA", limite=2)] == ["João Silva", "José da Silva"]
+    assert indice.buscar("") == []
+    assert indice.buscar("Pedro") == []
@@ -0,0 +1,83 @@
+"""
+Testes da instrumentação de desempenho
+"""
+
+import threading
+
+import pytest
+
+import src.instrumentacao as instrumentacao
+from src.instrumentacao import _percentil, instrumentar, obter_resumo
+
+
+@pytest.fixture
+def ativo(monkeypatch):
+    monkeypatch.setattr(instrumentacao, "ATIVO", True)
+    monkeypatch.setattr(instrumentacao, "_medicoes", {})
+
+
+def test_desativada_devolve_a_propria_funcao(monkeypatch):
+    monkeypatch.setattr(instrumentacao, "ATIVO", False)
+
+    def funcao():
+        return 1
+
+    assert instrumentar("funcao")(funcao) is funcao
+
+
+def test_medicoes_e_resumo(ativo):
+    @instrumentar("dobrar")
+    def dobrar(x):
+        return 2 * x
+
+    @instrumentar("falhar")
+    def falhar():
+        raise ValueError("erro")
+
+    assert [dobrar(i) for i in range(10)] == [2 * i for i in range(10)]
+    with pytest.raises(ValueError):
+        falhar()
+
+    resumo = obter_resumo()
+    assert resumo["dobrar"]["contagem"] == 10
+    assert resumo["falhar"]["contagem"] == 1
+    medidas = resumo["dobrar"]
+    assert 0 <= medidas["p50_ms"] <= medidas["p95_ms"] <= medidas["max_ms"] <= medidas["total_ms"]
+    assert medidas["media_ms"] == pytest.approx(medidas["total_ms"] / 10)
+
+
+def test_percentil():
+    valores = [float(i) for i in range(1, 101)]
+    assert _percentil(valores, 0) == 1
+    assert _percentil(valores, 50) == 50
+    assert _percentil(valores, 95) == 95
+    assert _percentil(valores, 100) == 100
+    assert _percentil([7.0], 95) == 7
+
+
+def test_cprofile_aninhado_ou_simultaneo_so_mede(ativo, tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumentacao, "DIR_CPROFILE", str(tmp_path))
+    dentro = threading.Event()
+    liberar = threading.Event()
+
+    @instrumentar("interna")
+    def interna():
+        return "ok"
+
+    @instrumentar("externa")
+    def externa():
+        dentro.set()
+        liberar.wait(5)
+        return interna()
+
+    thread = threading.Thread(target=externa)
+    thread.start()
+    dentro.wait(5)
+    # Chamada em outra thread enquanto a externa está sendo perfilada
+    assert interna() == "ok"
+    liberar.set()
+    thread.join()
+
+    assert sorted(arquivo.name for arquivo in tmp_path.iterdir()) == ["externa_1.prof"]
+    assert obter_resumo()["interna"]["contagem"] == 2
+    assert not instrumentacao._lock_cprofile.locked()
@@ -0,0 +1,233 @@
+"""
+Testes do cadastro de pacientes (SistemaClinica e Paciente)
+"""
+
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+import pytest
+
+from src.main import Paciente, SistemaClinica, particao_do_cpf
+
+
+def paciente_dict(nome, cpf, data_cadastro):
+    return {"nome": nome, "idade": 30, "telefone": "(11) 98765-4321",
+            "cpf": cpf, "data_cadastro": data_cadastro}
+
+
+def novo_sistema(diretorio, **kwargs):
+    return SistemaClinica(os.path.join(diretorio, "data", "pacientes.json"),
+                          os.path.join(diretorio, "backups"), **kwargs)
+
+
+@pytest.mark.parametrize("texto", ["2025-10-15 08:30:00", "2024-02-29 23:59:59"])
+def test_data_iso_usa_timestamp(texto):
+    paciente = Paciente.from_dict(paciente_dict("Ana", "", texto))
+    assert paciente._data_cadastro_texto is None
+    assert paciente.data_cadastro == texto
+
+
+@pytest.mark.parametrize("texto", ["", "ontem", "15/10/2025 08:30", "2025-10-15T08:30:00"])
+def test_data_fora_do_padrao_e_mantida(texto):
+    paciente = Paciente.from_dict(paciente_dict("Ana", "", texto))
+    assert paciente.to_dict()["data_cadastro"] == texto
+
+
+def test_data_brasileira_e_interpretada():
+    paciente = Paciente.from_dict(paciente_dict("Ana", "", "15/10/2025 08:30"))
+    assert time.localtime(paciente.timestamp_cadastro)[:5] == (2025, 10, 15, 8, 30)
+
+
+def test_horario_inexistente_no_horario_de_verao(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset indisponível")
+    monkeypatch.setenv("TZ", "America/Sao_Paulo")
+    time.tzset()
+    try:
+        texto = "2018-11-04 00:30:00"
+        assert Paciente.from_dict(paciente_dict("Ana", "", texto)).data_cadastro == texto
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_data_invalida_nao_impede_carregamento(tmp_path):
+    sistema = novo_sistema(str(tmp_path))
+    dados = [paciente_dict("Ana Souza", "529.982.247-25", "2025-10-15 08:30:00"),
+             paciente_dict("Bruno Lima", "111.444.777-35", "data desconhecida")]
+    with open(sistema.arquivo_dados, 'w', encoding='utf-8') as f:
+        json.dump(dados, f)
+
+    sistema.carregar_dados()
+    assert len(sistema.pacientes) == 2
+
+    sistema.salvar_dados()
+    with open(sistema.arquivo_dados, 'r', encoding='utf-8') as f:
+        assert json.load(f) == dados
+
+
+@pytest.mark.parametrize("num_particoes", [0, 2])
+def test_data_invalida_fica_fora_dos_contadores(tmp_path, num_particoes):
+    dados = [paciente_dict("Ana Souza", "529.982.247-25", "2025-10-15 08:30:00"),
+             paciente_dict("Bruno Lima", "111.444.777-35", "data desconhecida")]
+    origem = novo_sistema(str(tmp_path), num_particoes=num_particoes)
+    for registro in dados:
+        origem.adicionar_paciente(Paciente.from_dict(registro))
+    origem.salvar_dados()
+
+    for sistema in (origem, novo_sistema(str(tmp_path), num_particoes=num_particoes)):
+        indice = sistema.indice_cadastro
+        assert [p.nome for p in indice.sem_data] == ["Bruno Lima"]
+        assert sum(indice.por_hora.values()) == sum(indice.por_dia.values()) == 1
+        assert indice.contar_periodo(datetime.fromtimestamp(-86400), datetime(9999, 1, 1)) == 1
+        assert sum(indice.contagem_por_hora_do_dia().values()) == 1
+
+
+def cadastrar(sistema, quantidade, semente=11):
+    from benchmarks.dados_sinteticos import gerar_pacientes
+    for dados in gerar_pacientes(quantidade, semente):
+        sistema.adicionar_paciente(Paciente.from_dict(dados))
+
+
+def resumo(sistema):
+    return sorted((p.cpf, p.nome, p.idade, p.telefone, p.data_cadastro) for p in sistema.pacientes)
+
+
+def test_particoes_ida_e_volta(tmp_path):
+    sistema = novo_sistema(str(tmp_path), num_particoes=4)
+    cadastrar(sistema, 300)
+    sistema.salvar_dados()
+    assert not sistema._particoes_alteradas
+
+    recarregado = novo_sistema(str(tmp_path), num_particoes=4)
+    assert resumo(recarregado) == resumo(sistema)
+    assert not recarregado._particoes_alteradas
+    for numero, pacientes in enumerate(recarregado._particoes):
+        assert pacientes
+        assert all(particao_do_cpf(p.cpf, 4) == numero for p in pacientes)
+    timestamps = [p.timestamp_cadastro for p in recarregado.pacientes]
+    assert timestamps == sorted(timestamps)
+    assert recarregado.buscar_por_cpf(sistema.pacientes[0].cpf).nome == sistema.pacientes[0].nome
+    assert recarregado.indice_cadastro.por_dia == sistema.indice_cadastro.por_dia
+    assert recarregado.indice_idade.histograma() == sistema.indice_idade.histograma()
+
+
+def test_particoes_com_outra_quantidade_sao_redistribuidas(tmp_path):
+    sistema = novo_sistema(str(tmp_path), num_particoes=4)
+    cadastrar(sistema, 200)
+    sistema.salvar_dados()
+
+    redistribuido = novo_sistema(str(tmp_path), num_particoes=3)
+    assert redistribuido._particoes_alteradas == {0, 1, 2}
+    redistribuido.salvar_dados()
+    assert len(redistribuido._arquivos_particoes_existentes()) == 3
+    assert resumo(novo_sistema(str(tmp_path), num_particoes=3)) == resumo(sistema)
+
+
+def test_particao_com_falha_na_gravacao_continua_pendente(tmp_path, monkeypatch):
+    sistema = novo_sistema(str(tmp_path), num_particoes=4)
+    cadastrar(sistema, 100)
+    falha = sistema._arquivo_particao(2)
+    gravar = SistemaClinica._gravar_json
+
+    def gravar_com_falha(caminho, dados):
+        if caminho == falha:
+            raise OSError("disco cheio")
+        gravar(caminho, dados)
+
+    monkeypatch.setattr(SistemaClinica, "_gravar_json", staticmethod(gravar_com_falha))
+    sistema.salvar_dados()
+    assert sistema._particoes_alteradas == {2}
+    assert not os.path.exists(falha)
+
+    monkeypatch.setattr(SistemaClinica, "_gravar_json", staticmethod(gravar))
+    sistema.salvar_dados()
+    assert not sistema._particoes_alteradas
+    assert resumo(novo_sistema(str(tmp_path), num_particoes=4)) == resumo(sistema)
+
+
+def test_migracao_renomeia_arquivo_unico(tmp_path, capsys):
+    unico = novo_sistema(str(tmp_path))
+    cadastrar(unico, 50)
+    unico.salvar_dados()
+
+    particionado = novo_sistema(str(tmp_path), num_particoes=2)
+    assert resumo(particionado) == resumo(unico)
+    particionado.salvar_dados()
+    assert not os.path.exists(unico.arquivo_dados)
+    assert os.path.exists(unico.arquivo_dados + ".migrado")
+
+    capsys.readouterr()
+    assert novo_sistema(str(tmp_path)).pacientes == []
+    assert "dados particionados" in capsys.readouterr().out
+
+
+def test_arquivo_unico_nao_lido_nao_e_aposentado(tmp_path, capsys):
+    unico = novo_sistema(str(tmp_path))
+    cadastrar(unico, 20)
+    unico.salvar_dados()
+    novo_sistema(str(tmp_path), num_particoes=2).salvar_dados()
+    with open(unico.arquivo_dados + ".migrado", encoding="utf-8") as f:
+        backup = f.read()
+
+    # Um cadastro feito depois em modo de arquivo único não pode sumir
+    depois = novo_sistema(str(tmp_path))
+    depois.adicionar_paciente(Paciente("Bruno", 40, "(11) 98765-4321", "529.982.247-25"))
+    depois.salvar_dados()
+
+    capsys.readouterr()
+    particionado = novo_sistema(str(tmp_path), num_particoes=2)
+    particionado.adicionar_paciente(Paciente("Carla", 30, "(11) 98765-4321", "111.444.777-35"))
+    particionado.salvar_dados()
+    assert "não foi migrado" in capsys.readouterr().out
+    with open(unico.arquivo_dados, encoding="utf-8") as f:
+        assert [p["nome"] for p in json.load(f)] == ["Bruno"]
+    with open(unico.arquivo_dados + ".migrado", encoding="utf-8") as f:
+        assert f.read() == backup
+
+
+def test_segunda_migracao_nao_sobrescreve_backup(tmp_path):
+    primeiro = novo_sistema(str(tmp_path))
+    cadastrar(primeiro, 20)
+    primeiro.salvar_dados()
+    novo_sistema(str(tmp_path), num_particoes=2).salvar_dados()
+
+    # Partições apagadas e um novo arquivo único migrado outra vez
+    shutil.rmtree(primeiro.dir_particoes)
+    segundo = novo_sistema(str(tmp_path))
+    cadastrar(segundo, 5, semente=3)
+    segundo.salvar_dados()
+    novo_sistema(str(tmp_path), num_particoes=2).salvar_dados()
+
+    pasta = os.path.dirname(primeiro.arquivo_dados)
+    assert len([nome for nome in os.listdir(pasta) if ".migrado" in nome]) == 2
+    with open(primeiro.arquivo_dados + ".migrado", encoding="utf-8") as f:
+        assert len(json.load(f)) == 20
+
+
+def test_idade_fracionaria_carrega(tmp_path):
+    sistema = novo_sistema(str(tmp_path))
+    dados = dict(paciente_dict("Ana", "529.982.247-25", "2025-10-15 08:30:00"), idade=30.0)
+    with open(sistema.arquivo_dados, "w", encoding="utf-8") as f:
+        json.dump([dados], f)
+
+    recarregado = novo_sistema(str(tmp_path))
+    assert len(recarregado.pacientes) == 1
+    assert recarregado.indice_idade.contar_intervalo(30, 30) == 1
+
+
+def test_falha_nos_indices_mantem_cadastro_anterior(tmp_path):
+    sistema = novo_sistema(str(tmp_path))
+    ana = Paciente("Ana", 30, "(11) 98765-4321", "529.982.247-25")
+    sistema.adicionar_paciente(ana)
+    with open(sistema.arquivo_dados, "w", encoding="utf-8") as f:
+        json.dump([dict(paciente_dict("Bia", "111.444.777-35", "2025-10-15 08:30:00"),
+                        idade="trinta")], f)
+
+    sistema.carregar_dados()
+    assert sistema.pacientes == [ana]
+    assert sistema.indice_idade.total == 1
+    assert sistema.buscar_por_cpf("52998224725") is ana